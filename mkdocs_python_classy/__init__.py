@@ -2,29 +2,136 @@
 
 import re
 import os
+import json
+import time
+import logging
+import collections
 
+from html import escape
 from shutil import copy
 from string import Template
 from typing import Optional
 from importlib.metadata import version
 
+from markdown import Markdown
+from markdown.extensions.toc import unique
 from mkdocs.config import config_options
 from mkdocs.config.base import Config
 from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.exceptions import PluginError
 from mkdocs.plugins import BasePlugin
 from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
 from mkdocs.structure.nav import Navigation
 from mkdocs.utils.meta import get_data
 
-from mkdocs_python_classy.utils import get_dotted_path, relative_path
-from mkdocs_python_classy.inspector import Inspector
-from mkdocs_python_classy.constants import TEMPLATE_STRING
+from mkdocs_python_classy.extension import ClassyExtension, get_highlighter
+from mkdocs_python_classy.render import (
+    get_shared_anchor,
+    get_shared_members,
+    render_ancestors,
+    render_ancestors_html,
+    render_attributes,
+    render_attributes_html,
+    render_descendants,
+    render_descendants_html,
+    render_methods,
+    render_methods_html,
+    render_shared_links,
+    render_shared_links_html,
+    split_shared_members,
+)
+from mkdocs_python_classy.shard import get_shard, parse_shard
+from mkdocs_python_classy.utils import BudgetExceeded, get_file_hash, time_budget
+from mkdocs_python_classy.inspector import Inspector, SnapshotInspector
+from mkdocs_python_classy.constants import (
+    HTML_TEMPLATE_STRING,
+    MANIFEST_FILENAME,
+    SHARD_MANIFEST_FILENAME,
+    SHARED_HTML_TEMPLATE_STRING,
+    SHARED_SKIPPED_TEMPLATE_STRING,
+    SHARED_TEMPLATE_STRING,
+    SKIPPED_TEMPLATE_STRING,
+    TEMPLATE_STRING,
+)
 
 __version__ = version(__package__)
 
+LOGGER = logging.getLogger(f"mkdocs.plugins.{__name__}")
 
-class MkDocsPythonClassyPlugin(BasePlugin):
+
+def get_classy_urls(files):
+    """Get the url of each documentation page that has a `classy_dotted_path` in the front matter."""
+    urls = {}
+    for file in files:
+        if not file.is_documentation_page():
+            continue
+        with open(file.abs_src_path, encoding="utf-8-sig", errors="strict") as the_file:
+            data = get_data(the_file.read())[1]
+            if data.get("classy_dotted_path"):
+                dotted_string = data["classy_dotted_path"]
+                if file.url:
+                    urls[dotted_string] = "/" + re.sub(".html$", ".md", file.url)
+    return urls
+
+
+def get_shared_ancestors(datas, klasses=None):
+    """Get the ancestors found in the MRO of more than one class on the same page, in order of appearance.
+
+    Args:
+        datas (dict): The data of each class inspected on the page, as found in `KlassInspector.get_data`.
+        klasses (list): The dotted_path of every class with a section on the page, in order, defaults to `datas`.
+
+    Returns:
+        dict: The name and anchor for each dotted_path, the anchor being the section of the class when it is
+            rendered on the page already, or otherwise a shared section.
+    """
+    counts = collections.Counter()
+    names = {}
+    for data in datas.values():
+        for ancestor in data["ancestors"][1:]:
+            counts[ancestor["dotted_path"]] += 1
+            names.setdefault(ancestor["dotted_path"], ancestor["name"])
+    # Sections with the same heading get a `_1`, `_2`... suffix from the toc extension, in order of the page.
+    ids = set()
+    anchors = {dotted_path: unique(dotted_path.rsplit(".", 1)[1].lower(), ids) for dotted_path in klasses or datas}
+    shared = {}
+    for dotted_path, name in names.items():
+        if counts[dotted_path] > 1:
+            anchor = anchors[dotted_path] if dotted_path in datas else unique(get_shared_anchor(name), ids)
+            shared[dotted_path] = {"name": name, "anchor": anchor}
+    return shared
+
+
+def get_snapshot_path(plugin_config, config):
+    """Get the path of the `classy_snapshot`, relative paths are based on the directory of the config file."""
+    return os.path.join(os.path.dirname(config["config_file_path"] or ""), plugin_config["classy_snapshot"])
+
+
+def get_inspector(plugin_config, urls, pages=None):
+    """Get the Inspector based on the `classy_*` options of the plugin and the urls of the classy pages.
+
+    Args:
+        plugin_config (dict): The `classy_*` options of the plugin.
+        urls (dict): The url of each classy page, as found in `get_classy_urls`.
+        pages (list): The `classy_dotted_path` of the pages to inspect the classes of, None for all pages.
+    """
+    strategy = plugin_config["classy_strategy"]
+    subclasses = plugin_config["classy_subclasses"] if strategy == "module" else list(urls.keys())
+    modules = plugin_config["classy_modules"] if strategy == "subclass" else list(urls.keys())
+    return Inspector(
+        strategy,
+        subclasses,
+        modules,
+        urls,
+        plugin_config["classy_libraries"],
+        workers=plugin_config["classy_workers"],
+        pages=pages,
+        discovery=plugin_config["classy_discovery"],
+    )
+
+
+class MkDocsPythonClassyPlugin(BasePlugin):  # pylint: disable=too-many-instance-attributes
     """MkDocs plugin entry point for mkdocs-python-classy."""
 
     config_scheme = (
@@ -32,8 +139,25 @@ class MkDocsPythonClassyPlugin(BasePlugin):
         ("classy_subclasses", config_options.ListOfItems(config_options.Type(str), default=[])),
         ("classy_modules", config_options.ListOfItems(config_options.Type(str), default=[])),
         ("classy_libraries", config_options.ListOfItems(config_options.Type(str))),
+        ("classy_snapshot", config_options.Optional(config_options.Type(str))),
+        ("classy_deduplicate", config_options.Type(bool, default=False)),
+        ("classy_workers", config_options.Type(int, default=1)),
+        ("classy_class_timeout", config_options.Type((int, float), default=0)),
+        ("classy_module_timeout", config_options.Type((int, float), default=0)),
+        ("classy_strict_timeout", config_options.Type(bool, default=False)),
+        ("classy_shard", config_options.Optional(config_options.Type(str))),
+        ("classy_output", config_options.Choice(tuple(["markdown", "html"]), default="markdown")),
+        ("classy_discovery", config_options.Choice(tuple(["modules", "subclasses"]), default="modules")),
     )
     inspector = None
+    extension = None
+    previous_manifest = None
+    classy_outputs = None
+    skipped_klasses = None
+    shard = None
+    shard_pages = None
+    shard_outputs = None
+    markdown = None
 
     def on_config(self, config, **kwargs):  # pylint: disable=unused-argument
         if "markdown_extensions" not in config:
@@ -44,131 +168,315 @@ class MkDocsPythonClassyPlugin(BasePlugin):
             config["markdown_extensions"].append("pymdownx.details")
         if "pymdownx.superfences" not in config["markdown_extensions"]:
             config["markdown_extensions"].append("pymdownx.superfences")
+        if self.config["classy_shard"]:
+            try:
+                self.shard = parse_shard(self.config["classy_shard"])
+            except ValueError as error:
+                raise PluginError(str(error)) from error
+        if self.config["classy_discovery"] == "subclasses" and self.config["classy_strategy"] != "subclass":
+            raise PluginError("The `classy_discovery: subclasses` option is only supported by the subclass strategy.")
+        self.extension = ClassyExtension()
+        self.markdown = None
+        config["markdown_extensions"].append(self.extension)
         config["extra_css"].append("classy.css")
         return config
 
+    def on_pre_build(self, *, config: MkDocsConfig):
+        """Load the manifest of the previous build, prior to MkDocs cleaning the site_dir."""
+        self.previous_manifest = {}
+        self.classy_outputs = set()
+        self.skipped_klasses = []
+        self.shard_outputs = {}
+        manifest_path = os.path.join(config["site_dir"], MANIFEST_FILENAME)
+        if os.path.isfile(manifest_path):
+            with open(manifest_path, encoding="utf-8") as the_file:
+                try:
+                    self.previous_manifest = json.load(the_file)
+                except ValueError:
+                    self.previous_manifest = {}
+
     def on_nav(self, nav: Navigation, *, config: MkDocsConfig, files: Files) -> Optional[Navigation]:
-        urls = {}
-        for file in files:
-            if not file.is_documentation_page():
-                continue
-            with open(file.abs_src_path, encoding="utf-8-sig", errors="strict") as the_file:
-                data = get_data(the_file.read())[1]
-                if data.get("classy_dotted_path"):
-                    dotted_string = data["classy_dotted_path"]
-                    if file.page.url:
-                        urls[dotted_string] = "/" + re.sub(".html$", ".md", file.page.url)
-        strategy = self.config["classy_strategy"]
-        subclasses = self.config["classy_subclasses"] if strategy == "module" else list(urls.keys())
-        modules = self.config["classy_modules"] if strategy == "subclass" else list(urls.keys())
-        self.inspector = Inspector(
-            self.config["classy_strategy"], subclasses, modules, urls, self.config["classy_libraries"]
-        )
+        urls = get_classy_urls(files)
+        # Computed prior to loading any snapshot, so a snapshot can be rendered across shards as well.
+        if self.shard:
+            self.shard_pages = {i for i in urls if get_shard(i, self.shard[1]) == self.shard[0]}
+        if self.config["classy_snapshot"]:
+            snapshot_path = get_snapshot_path(self.config, config)
+            if not os.path.isfile(snapshot_path):
+                raise PluginError(
+                    f"The classy_snapshot {snapshot_path} does not exist, create it with `mkdocs-classy inspect`."
+                )
+            with open(snapshot_path, encoding="utf-8") as the_file:
+                self.inspector = SnapshotInspector(json.load(the_file), urls)
+            return nav
+        self.inspector = get_inspector(self.config, urls, pages=self.shard_pages)
         return nav
 
-    def on_page_markdown(self, markdown: str, *, page: Page, config: Config, files: Files) -> str:
+    def on_page_markdown(  # pylint: disable=too-many-locals,too-many-branches
+        self, markdown: str, *, page: Page, config: Config, files: Files
+    ) -> str:
         """
         Called on each file after it is read and before it is converted to HTML.
         """
-        with open(page.file.abs_src_path, encoding="utf-8-sig", errors="strict") as the_file:
-            text = the_file.read()
-        if not get_data(text)[1].get("classy_dotted_path"):
+        # The meta data was already parsed by MkDocs, so pages without classy front matter are skipped
+        # without any further processing, and the markdown extension is left disabled for them.
+        self.extension.set_badges([])
+        self.extension.set_blocks([])
+        module = page.meta.get("classy_dotted_path")
+        if not module:
             return markdown
-        module = get_data(text)[1].get("classy_dotted_path")
+        if self.shard_pages is not None:
+            if module not in self.shard_pages:
+                return f"# `{module}` Found Classes\n\nThis page is rendered by shard {get_shard(module, self.shard[1])}.\n"
+            self.shard_outputs[page.file.dest_uri] = page.url
+        self.classy_outputs.add(page.file.dest_uri)
 
         output = f"# `{module}` Found Classes"
         render_each = []
         for name, value in self.inspector.klasses.items():
             if value["subclass_path"] == module:
                 render_each.append(name)
+        html = self.config["classy_output"] == "html"
+        highlight = self.get_highlighter(config) if html else None
+        badges = []
+        blocks = []
+        page_start = time.perf_counter()
+        datas = {}
         for item in sorted(render_each):
-            output = output + self.get_context(item)
+            datas[item] = self.run_with_budget(item, module, page_start, self.inspector.get_klass_data, item)
+        inspected = {item: data for item, data in datas.items() if data is not None}
+        shared = get_shared_ancestors(inspected, list(datas)) if self.config["classy_deduplicate"] else {}
+        for item, data in datas.items():
+            # Badges are collected per class, so a class that is interrupted does not leave partial badges behind.
+            klass_badges = []
+            context = None
+            if data is not None:
+                context = self.run_with_budget(
+                    item,
+                    module,
+                    page_start,
+                    self.get_html_context if html else self.get_context,
+                    item,
+                    blocks if html else klass_badges,
+                    shared=shared,
+                    data=data,
+                    **({"highlight": highlight} if html else {}),
+                )
+            if context is None:
+                context = Template(SKIPPED_TEMPLATE_STRING).substitute(name=item.split(".")[-1], dotted_path=item)
+                klass_badges = []
+            output = output + context
+            badges.extend(klass_badges)
+        for dotted_path, shared_ancestor in shared.items():
+            if dotted_path not in inspected:
+                name = shared_ancestor["name"]
+                shared_badges = []
+                context = self.run_with_budget(
+                    dotted_path,
+                    module,
+                    page_start,
+                    self.get_shared_html_context if html else self.get_shared_context,
+                    dotted_path,
+                    name,
+                    inspected,
+                    blocks if html else shared_badges,
+                    *([highlight] if html else []),
+                )
+                if context is None:
+                    context = Template(SHARED_SKIPPED_TEMPLATE_STRING).substitute(name=name, dotted_path=dotted_path)
+                    shared_badges = []
+                output += context
+                badges.extend(shared_badges)
+        self.extension.set_badges(badges)
+        self.extension.set_blocks(blocks)
         return output
 
-    def on_page_content(self, html: str, *, page: Page, config: Config, files: Files) -> str:
-        if re.search("CLASSY_DELIMITER", html):
-            html = re.sub("CLASSY_DELIMITER (\\S+)", r'<small class="pull-right">\1</small>', html)
-        return html
+    def get_highlighter(self, config):
+        """Get the function to highlight code with, from a Markdown instance configured the same as the pages.
+
+        The instance is created once per build, so the html of each class can be rendered within its time budget,
+        rather than when the page is converted.
+        """
+        if self.markdown is None:
+            self.markdown = Markdown(
+                extensions=config["markdown_extensions"], extension_configs=config["mdx_configs"] or {}
+            )
+        # Reset for each page, so the state of the highlighter (such as the count of code blocks) matches the page.
+        self.markdown.reset()
+        return get_highlighter(self.markdown)
+
+    def run_with_budget(self, name, module, page_start, func, *args, **kwargs):  # pylint: disable=too-many-arguments
+        """Run the inspection or rendering of a class within the time budgets, returning None when exceeded.
+
+        Args:
+            name (str): The dotted_path of the class.
+            module (str): The `classy_dotted_path` of the page the class is rendered on.
+            page_start (float): When the page started, to account for the budget of the page.
+            func (callable): The function to run, with `args` and `kwargs`.
+        """
+        seconds = self.config["classy_class_timeout"] or None
+        if self.config["classy_module_timeout"]:
+            remaining = self.config["classy_module_timeout"] - (time.perf_counter() - page_start)
+            seconds = remaining if seconds is None else min(seconds, remaining)
+        start = time.perf_counter()
+        try:
+            with time_budget(seconds):
+                return func(*args, **kwargs)
+        except BudgetExceeded as error:
+            elapsed = time.perf_counter() - start
+            if self.config["classy_strict_timeout"]:
+                raise PluginError(f"The class {name} on page {module} exceeded its time budget: {error}") from error
+            self.skipped_klasses.append((name, module, elapsed))
+            return None
+
+    def get_context(self, name, badges=None, shared=None, data=None):
+        """Get all of the relevant data and convert to the final markdown.
 
-    def get_context(self, name):
-        """Get all of the relevant data and convert to the final markdown."""
+        Args:
+            name (str): The dotted_path of the class to render.
+            badges (list): Collects the "defined in" badges of each method, in the order they are rendered.
+            shared (dict): The ancestors rendered once per page, as found in `get_shared_ancestors`.
+            data (dict): The data of the class, as found in `KlassInspector.get_data`, fetched when not provided.
+        """
         context = {}
-        inspect_obj = self.inspector.klass_details[name]
-
-        def _ancestors(ancestors, urls, current_url, path_short_map):
-            _out = f"1. {ancestors[0].__name__}\n"
-
-            for ancestor in ancestors[1:]:
-                name = ancestor.__name__
-                module_path = get_dotted_path(ancestor)
-                if urls.get(module_path):
-                    path = relative_path(urls[module_path]["url"], current_url)
-                    _out += f"1. [{name}]({path})\n"
-                elif urls.get(path_short_map.get(ancestor.__name__)):
-                    path = relative_path(urls[path_short_map[ancestor.__name__]]["url"], current_url)
-                    _out += f"1. [{name}]({path})\n"
-                else:
-                    _out += f"1. {name}\n"
-            return _out
-
-        def _descendants(descendants, urls, current_url, name):
-            if not descendants:
-                return ""
-            _out = f"The below Classes rely on: `{name}`.\n\n"
-            for descendant in descendants:
-                module_path = get_dotted_path(descendant)
-                _out += f"- [{descendant.__name__}]({relative_path(urls[module_path]['url'], current_url)})\n"
-            return _out
-
-        def _attributes(attributes):
-            if not attributes:
-                return "No attributes in `{{ this_module }}.{{ name }}`"
-            _out = "| Key | Value | Defined in |\n"
-            _out += "| :-- | :---- | :--------- |\n"
-            previous_name = None
-            for attribute in attributes:
-                name = attribute.name
-                if previous_name == attribute.name:
-                    name = f"~~{name}~~"
-                _out += f"{name} | `{attribute.attr_code}` | {attribute.classobject.__name__ } |\n"
-                previous_name = attribute.name
-
-            return _out
-
-        def _methods(methods):
-            _out = ""
-            for method in methods:
-                _out += f"""??? quote "`def {method.name}({method.params_string()}):` CLASSY_DELIMITER {method.classobject.__name__ }"\n"""
-                _out += "    \n"
-                children = [method] + method.children
-                for child in children:
-                    if len(children) != 1:
-                        _out += "    \n"
-                        _out += f"    **{child.classobject.__name__}**\n"
-                    _out += "    \n"
-                    _out += f'    ``` py linenums="{child.line_number()}"\n'
-                    _out += "    \n"
-                    for line in child.code().splitlines():
-                        _out += f"    {line}\n"
-                    _out += "    ```\n"
-                _out += "\n"
-            return _out
+        if badges is None:
+            badges = []
+        if data is None:
+            data = self.inspector.get_klass_data(name)
+        attributes, methods, attribute_shared, method_shared = split_shared_members(data, shared)
+        attribute_links = render_shared_links(attribute_shared, "attributes")
+        method_links = render_shared_links(method_shared, "methods")
 
         current_url = self.inspector.klasses[name]["url"].split("#")[0]
         context["name"] = name.split(".")[-1]
         context["import_statment"] = f"from {name.rsplit('.', 1)[0]} import {name.rsplit('.', 1)[1]}"
-        context["ancestors"] = _ancestors(
-            inspect_obj.get_klass_mro(), self.inspector.klasses, current_url, self.inspector.klass_short
+        context["ancestors"] = render_ancestors(
+            data["ancestors"], self.inspector.klasses, current_url, self.inspector.klass_short
         )
-        context["descendants"] = _descendants(
-            inspect_obj.get_children(), self.inspector.klasses, current_url, context["name"]
+        context["descendants"] = render_descendants(
+            data["descendants"], self.inspector.klasses, current_url, context["name"]
         )
-        context["attributes"] = _attributes(inspect_obj.get_attributes())
-        context["methods"] = _methods(inspect_obj.get_methods())
+        context["attributes"] = render_attributes(attributes) if attributes or not attribute_links else ""
+        context["attributes"] += attribute_links
+        context["methods"] = render_methods(methods, badges) + method_links
         return Template(TEMPLATE_STRING).substitute(**context)
 
+    def get_html_context(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, name, blocks, shared=None, data=None, highlight=None
+    ):
+        """Get all of the relevant data, and add the html block to render in place of the markdown.
+
+        Args:
+            name (str): The dotted_path of the class to render.
+            blocks (list): Collects the html blocks of the page, in the order they are rendered.
+            shared (dict): The ancestors rendered once per page, as found in `get_shared_ancestors`.
+            data (dict): The data of the class, as found in `KlassInspector.get_data`, fetched when not provided.
+            highlight (callable): Highlights the code, as found in `get_highlighter`.
+        """
+        context = {}
+        if data is None:
+            data = self.inspector.get_klass_data(name)
+        attributes, methods, attribute_shared, method_shared = split_shared_members(data, shared)
+        attribute_links = render_shared_links_html(attribute_shared, "attributes")
+
+        current_url = self.inspector.klasses[name]["url"].split("#")[0]
+        short_name = name.split(".")[-1]
+        context["import_statment"] = highlight(f"from {name.rsplit('.', 1)[0]} import {short_name}")
+        context["ancestors"] = render_ancestors_html(
+            data["ancestors"], self.inspector.klasses, current_url, self.inspector.klass_short
+        )
+        context["descendants"] = render_descendants_html(
+            data["descendants"], self.inspector.klasses, current_url, short_name
+        )
+        context["attributes"] = render_attributes_html(attributes) if attributes or not attribute_links else ""
+        context["attributes"] += attribute_links
+        context["methods"] = render_methods_html(methods, highlight) + render_shared_links_html(
+            method_shared, "methods"
+        )
+        blocks.append(Template(HTML_TEMPLATE_STRING).substitute(**context))
+        return f"\n## `{short_name}`" + self.extension.get_block_placeholder(len(blocks) - 1)
+
+    def get_shared_context(self, dotted_path, name, datas, badges):
+        """Get the markdown of the members defined in a shared ancestor, rendered once per page.
+
+        Args:
+            dotted_path (str): The dotted_path of the shared ancestor.
+            name (str): The name of the shared ancestor.
+            datas (dict): The data of each class on the page, as found in `KlassInspector.get_data`.
+            badges (list): Collects the "defined in" badges of each method, in the order they are rendered.
+        """
+        attributes, methods = get_shared_members(dotted_path, name, datas)
+        context = {
+            "name": name,
+            "attributes": render_attributes(attributes),
+            "methods": render_methods(methods, badges),
+        }
+        return Template(SHARED_TEMPLATE_STRING).substitute(**context)
+
+    def get_shared_html_context(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, dotted_path, name, datas, blocks, highlight
+    ):
+        """Get the html block of the members defined in a shared ancestor, rendered once per page.
+
+        Args:
+            dotted_path (str): The dotted_path of the shared ancestor.
+            name (str): The name of the shared ancestor.
+            datas (dict): The data of each class on the page, as found in `KlassInspector.get_data`.
+            blocks (list): Collects the html blocks of the page, in the order they are rendered.
+            highlight (callable): Highlights the code, as found in `get_highlighter`.
+        """
+        attributes, methods = get_shared_members(dotted_path, name, datas)
+        context = {
+            "name": escape(name),
+            "attributes": render_attributes_html(attributes),
+            "methods": render_methods_html(methods, highlight),
+        }
+        blocks.append(Template(SHARED_HTML_TEMPLATE_STRING).substitute(**context))
+        return f"\n## `{name}` Shared Members" + self.extension.get_block_placeholder(len(blocks) - 1)
+
     def on_post_build(self, *, config: MkDocsConfig):  # pylint: disable=unused-argument
-        """Copy the css into where we defined it before."""
+        """Copy the css into where we defined it before, and update the manifest of the generated files."""
         src = os.path.abspath(os.path.join(os.path.dirname(__file__), "./css/classy.css"))
         dst = os.path.join(config["site_dir"], "classy.css")
-        copy(src, dst)
+        if not os.path.isfile(dst) or get_file_hash(src) != get_file_hash(dst):
+            copy(src, dst)
+        self.classy_outputs.add("classy.css")
+        self.write_manifest(config["site_dir"])
+        if self.shard:
+            with open(os.path.join(config["site_dir"], SHARD_MANIFEST_FILENAME), "w", encoding="utf-8") as the_file:
+                shard_manifest = {"shard": self.shard[0], "shards": self.shard[1], "pages": self.shard_outputs}
+                json.dump(shard_manifest, the_file, indent=2, sort_keys=True)
+        if self.skipped_klasses:
+            summary = "\n".join(
+                f"  - {name} on {module} after {elapsed:.2f} seconds" for name, module, elapsed in self.skipped_klasses
+            )
+            LOGGER.warning("The below classes were skipped, as they exceeded their time budget:\n%s", summary)
+        if self.inspector.failures:
+            summary = "\n".join(f"  - {name}: {error}" for name, error in sorted(self.inspector.failures.items()))
+            LOGGER.warning(
+                "The below classes or modules could not be imported or inspected, and were skipped:\n%s", summary
+            )
+
+    def write_manifest(self, site_dir):
+        """Restore the mtime of generated files whose content did not change, and write the new manifest.
+
+        MkDocs always writes every page, so the content hash of each file generated by classy is compared
+        against the previous build, allowing deploys based on mtime (such as rsync) to skip the unchanged files.
+        """
+        manifest = {}
+        for dest_uri in sorted(self.classy_outputs):
+            path = os.path.join(site_dir, dest_uri)
+            if not os.path.isfile(path):
+                continue
+            file_hash = get_file_hash(path)
+            previous = self.previous_manifest.get(dest_uri)
+            if previous and previous.get("hash") == file_hash:
+                os.utime(path, ns=(previous["mtime_ns"], previous["mtime_ns"]))
+            manifest[dest_uri] = {"hash": file_hash, "mtime_ns": os.stat(path).st_mtime_ns}
+        manifest_path = os.path.join(site_dir, MANIFEST_FILENAME)
+        with open(manifest_path, "w", encoding="utf-8") as the_file:
+            json.dump(manifest, the_file, indent=2, sort_keys=True)
+        # The manifest only changes when one of the files changes, so keep its mtime deterministic as well.
+        if manifest:
+            mtime_ns = max(value["mtime_ns"] for value in manifest.values())
+            os.utime(manifest_path, ns=(mtime_ns, mtime_ns))
@@ -0,0 +1,75 @@
+"""Command line interface to run the inspection outside of a MkDocs build."""
+import argparse
+import json
+import sys
+
+from mkdocs.config import load_config
+from mkdocs.structure.files import get_files
+
+from mkdocs_python_classy.shard import merge_shards
+from mkdocs_python_classy import MkDocsPythonClassyPlugin, get_classy_urls, get_inspector, get_snapshot_path
+
+
+def get_plugin_config(config):
+    """Find the `classy_*` options of the plugin within a loaded MkDocs config."""
+    for plugin in config["plugins"].values():
+        if isinstance(plugin, MkDocsPythonClassyPlugin):
+            return plugin.config
+    raise ValueError("The mkdocs-python-classy plugin is not configured.")
+
+
+def inspect_command(args):
+    """Run discovery and inspection of all classes, and write the snapshot."""
+    config = load_config(config_file=args.config_file)
+    plugin_config = get_plugin_config(config)
+    output = args.output
+    if not output:
+        output = (
+            get_snapshot_path(plugin_config, config) if plugin_config["classy_snapshot"] else "classy_snapshot.json"
+        )
+    urls = get_classy_urls(get_files(config))
+    inspector = get_inspector(plugin_config, urls)
+    with open(output, "w", encoding="utf-8") as the_file:
+        json.dump(inspector.get_snapshot(), the_file, indent=2, sort_keys=True)
+    print(f"Wrote the inspection of {len(inspector.klasses)} classes to {output}")
+    for name, error in sorted(inspector.failures.items()):
+        print(f"Could not import {name}: {error}", file=sys.stderr)
+
+
+def merge_command(args):
+    """Merge the site_dir of each shard into a single site."""
+    merge_shards(args.shard_dirs, args.output)
+    print(f"Merged {len(args.shard_dirs)} shards into {args.output}")
+
+
+def main(argv=None):
+    """Entry point of the `mkdocs-classy` command."""
+    parser = argparse.ArgumentParser(prog="mkdocs-classy", description="Tooling for mkdocs-python-classy.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    inspect_parser = subparsers.add_parser(
+        "inspect", help="Inspect all classes and write a snapshot that can be loaded with `classy_snapshot`."
+    )
+    inspect_parser.add_argument(
+        "-f", "--config-file", default=None, help="The MkDocs configuration file, defaults to mkdocs.yml."
+    )
+    inspect_parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Where to write the snapshot file, defaults to `classy_snapshot` or classy_snapshot.json.",
+    )
+    inspect_parser.set_defaults(func=inspect_command)
+
+    merge_parser = subparsers.add_parser("merge", help="Merge the site_dir of each `classy_shard` build.")
+    merge_parser.add_argument("-o", "--output", required=True, help="The directory to write the merged site to.")
+    merge_parser.add_argument("shard_dirs", nargs="+", help="The site_dir of every shard.")
+    merge_parser.set_defaults(func=merge_command)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,11 @@
 """Module to keep all constants."""
 
+MANIFEST_FILENAME = "classy_manifest.json"
+
+SHARD_MANIFEST_FILENAME = "classy_shard.json"
+
+SNAPSHOT_VERSION = 3
+
 TEMPLATE_STRING = """
 ## `${name}`
 
@@ -26,3 +32,46 @@ ${attributes}
 ${methods}
 
 """
+
+HTML_TEMPLATE_STRING = """${import_statment}
+<p><strong>Ancestors (MRO)</strong></p>
+<p>The Method Resolution Order is described below.</p>
+${ancestors}<p><strong>Descendant Classes</strong></p>
+${descendants}<p><strong>Attributes</strong></p>
+${attributes}<p><strong>Methods</strong></p>
+${methods}"""
+
+SHARED_TEMPLATE_STRING = """
+## `${name}` Shared Members
+
+The below members are defined in `${name}`, which is an ancestor of multiple classes on this page.
+
+**Attributes**
+
+${attributes}
+
+**Methods**
+
+${methods}
+
+"""
+
+SHARED_HTML_TEMPLATE_STRING = """<p>The below members are defined in <code>${name}</code>, which is an ancestor of multiple classes on this \
+page.</p>
+<p><strong>Attributes</strong></p>
+${attributes}<p><strong>Methods</strong></p>
+${methods}"""
+
+SKIPPED_TEMPLATE_STRING = """
+## `${name}`
+
+The inspection of `${dotted_path}` was skipped, as it exceeded its time budget.
+
+"""
+
+SHARED_SKIPPED_TEMPLATE_STRING = """
+## `${name}` Shared Members
+
+The members defined in `${dotted_path}` were skipped, as they exceeded their time budget.
+
+"""
@@ -0,0 +1,126 @@
+"""Markdown extension to render the classy specific markup natively."""
+import re
+import collections
+import xml.etree.ElementTree as etree
+
+from markdown import Extension
+from markdown.preprocessors import Preprocessor
+from markdown.treeprocessors import Treeprocessor
+
+HTML_BLOCK_RE = re.compile(r"^<!-- classy-html (\d+) -->$")
+
+
+class ClassyBadgeTreeprocessor(Treeprocessor):  # pylint: disable=too-few-public-methods
+    """Add the "defined in" badge to each method summary generated by classy."""
+
+    def __init__(self, md, extension):
+        """Initialize the Class.
+
+        Args:
+            md (obj): The Markdown instance.
+            extension (obj): The ClassyExtension instance that holds the badges of the current page.
+        """
+        super().__init__(md)
+        self.extension = extension
+
+    def run(self, root):
+        """Apply the badges in document order, only when the current page was generated by classy."""
+        badges = self.extension.badges
+        if not badges:
+            return
+        for details in root.iter("details"):
+            if not badges:
+                break
+            if "quote" not in details.get("class", "").split():
+                continue
+            summary = details.find("summary")
+            if summary is None:
+                continue
+            # Append after the existing content, with a separating space as the previous markup had.
+            if len(summary):
+                summary[-1].tail = (summary[-1].tail or "") + " "
+            else:
+                summary.text = (summary.text or "") + " "
+            small = etree.SubElement(summary, "small")
+            small.set("class", "pull-right")
+            small.text = badges.popleft()
+
+
+class ClassyHtmlPreprocessor(Preprocessor):  # pylint: disable=too-few-public-methods
+    """Replace each html block placeholder generated by classy with the pre-rendered html, stashed as raw html."""
+
+    def __init__(self, md, extension):
+        """Initialize the Class.
+
+        Args:
+            md (obj): The Markdown instance.
+            extension (obj): The ClassyExtension instance that holds the html blocks of the current page.
+        """
+        super().__init__(md)
+        self.extension = extension
+
+    def run(self, lines):
+        """Stash the html blocks, only when the current page was generated by classy."""
+        blocks = self.extension.blocks
+        if not blocks:
+            return lines
+        new_lines = []
+        for line in lines:
+            match = HTML_BLOCK_RE.match(line)
+            if match:
+                line = self.md.htmlStash.store(blocks[int(match.group(1))].strip())
+            new_lines.append(line)
+        return new_lines
+
+
+def get_highlighter(md):
+    """Get a function to highlight python code the same way a fenced code block of the Markdown instance is.
+
+    Args:
+        md (obj): A Markdown instance with the pymdownx.superfences extension, so the configured highlighter is used.
+
+    Returns:
+        callable: Highlights the code given, starting at the `linenums` line number when provided.
+    """
+    fenced = md.preprocessors["fenced_code_block"]
+    fenced.get_hl_settings()
+
+    def highlight(code, linenums=None):
+        options = {"linenums": str(linenums)} if linenums is not None else {}
+        return fenced.highlight(src=code, language="py", options=options, md=md, classes=[], id_value="", attrs={})
+
+    return highlight
+
+
+class ClassyExtension(Extension):
+    """Markdown extension, the plugin sets the badges and html blocks for each page prior to conversion."""
+
+    def __init__(self, **kwargs):
+        """Initialize the extension with no badges or html blocks, so non classy pages are left untouched."""
+        super().__init__(**kwargs)
+        self.badges = collections.deque()
+        self.blocks = []
+
+    def set_badges(self, badges):
+        """Set the badges for the page about to be converted, an empty list disables the processor."""
+        self.badges = collections.deque(badges)
+
+    def set_blocks(self, blocks):
+        """Set the html blocks for the page about to be converted, an empty list disables the processor.
+
+        Args:
+            blocks (list): The html of each block, which the markdown of the page refers to with
+                `get_block_placeholder`.
+        """
+        self.blocks = list(blocks)
+
+    @staticmethod
+    def get_block_placeholder(index):
+        """Get the line the plugin places in the markdown, where the html block at `index` is rendered."""
+        return f"\n\n<!-- classy-html {index} -->\n\n"
+
+    def extendMarkdown(self, md):  # pylint: disable=invalid-name
+        """Register the tree processor after the inline processors, and the html preprocessor prior to fenced code."""
+        md.treeprocessors.register(ClassyBadgeTreeprocessor(md, self), "classy_badge", 15)
+        # After whitespace is normalized, and before fenced code and html blocks are parsed.
+        md.preprocessors.register(ClassyHtmlPreprocessor(md, self), "classy_html", 26)
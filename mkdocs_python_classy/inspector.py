@@ -2,13 +2,30 @@
 import collections
 import importlib
 import inspect
+import re
 import types
 
+from concurrent.futures import ProcessPoolExecutor
+
 from pygments import lex
 from pygments.lexers import PythonLexer  # pylint: disable=no-name-in-module
 from pygments.token import Token
 
-from mkdocs_python_classy.utils import import_string, get_dotted_path, get_attribute_code, is_function_attribute
+from mkdocs_python_classy.constants import SNAPSHOT_VERSION
+from mkdocs_python_classy.utils import (
+    import_string,
+    get_dotted_path,
+    get_library_pattern,
+    get_attribute_code,
+    get_class_members,
+    get_source_attribute_code,
+    get_source_file,
+    get_url_from_strategy,
+    is_function_attribute,
+)
+
+# The memory address in the default repr of objects, which changes on every build.
+MEMORY_ADDRESS_RE = re.compile(r" at 0x[0-9a-fA-F]+")
 
 
 class Attribute:
@@ -64,7 +81,7 @@ class Method(Attribute):
         defaults = list(argspec.defaults or [])
         for arg in argspec.args[::-1]:
             if defaults:
-                default = defaults.pop()
+                default = MEMORY_ADDRESS_RE.sub("", str(defaults.pop()))
                 stack.insert(0, f"{arg}={default}")
             else:
                 stack.insert(0, arg)
@@ -120,17 +137,175 @@ class Attributes(collections.abc.MutableSequence):
         self.__setitem__(index, value)  # pylint: disable=unnecessary-dunder-call
 
 
+def _is_method(attr):
+    return isinstance(attr, (types.FunctionType, types.MethodType))
+
+
+class MethodTable:  # pylint: disable=too-few-public-methods
+    """The methods defined by each class, computed once per build and shared by all KlassInspector instances.
+
+    Each class has its `__dict__` swept only once, the override chain of a class is then derived by merging the
+    entries of each class in its MRO, in order.
+    """
+
+    def __init__(self):
+        """Initialize the Class."""
+        self.defined = {}
+
+    def get_defined_methods(self, klass):
+        """Get the list of (name, method) tuples defined directly on the class, in definition order."""
+        if klass in self.defined:
+            return self.defined[klass]
+        methods = []
+        for attr_str in klass.__dict__.keys():
+            if attr_str.startswith("__") and not attr_str.startswith("__init__"):
+                continue
+            # Occasionally you will get an attribute that is a assigned to a function
+            # such as `objects = RestrictedQuerySet.as_manager()`, when this happens ensure it did
+            # not fail on a method in which you would re-raise the same issue, otherwise continue on.
+            try:
+                attr = getattr(klass, attr_str)
+            except Exception:
+                if not is_function_attribute(klass, attr_str):
+                    continue
+                raise
+            if _is_method(attr):
+                methods.append((attr_str, attr))
+        self.defined[klass] = methods
+        return methods
+
+
+class KlassRegistry:
+    """The class object and MRO of each dotted_path, resolved once per build and shared by all KlassInspector instances.
+
+    Classes found during discovery are registered with the object that was found, so they are never imported again
+    from their dotted_path. A dotted_path that fails to import is recorded in `failures`, so the rest of the build can
+    continue and the failures can be reported.
+    """
+
+    def __init__(self):
+        """Initialize the Class."""
+        self.klasses = {}
+        self.mros = {}
+        self.failures = {}
+
+    def register(self, dotted_path, klass):
+        """Register a class that was already resolved, such as during discovery."""
+        if dotted_path not in self.klasses:
+            self.klasses[dotted_path] = klass
+            self.mros[dotted_path] = klass.__mro__
+
+    def resolve(self, dotted_path):
+        """Get the class of the dotted_path, importing it only the first time, or None when the import failed."""
+        if dotted_path in self.klasses:
+            return self.klasses[dotted_path]
+        if dotted_path in self.failures:
+            return None
+        try:
+            klass = import_string(dotted_path)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.failures[dotted_path] = f"{type(error).__name__}: {error}"
+            return None
+        self.register(dotted_path, klass)
+        return klass
+
+    def resolve_module(self, module_str):
+        """Import a module, or return None and record the failure when the import failed."""
+        if module_str in self.failures:
+            return None
+        try:
+            return importlib.import_module(module_str)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.failures[module_str] = f"{type(error).__name__}: {error}"
+            return None
+
+    def get_mro(self, dotted_path):
+        """Get the MRO tuple of the class of the dotted_path."""
+        self.resolve(dotted_path)
+        return self.mros[dotted_path]
+
+
+class AttributeTable:
+    """The code of the class attributes, parsed once per source file, as a stage that runs prior to inspection."""
+
+    def __init__(self):
+        """Initialize the Class."""
+        self.sources = {}
+        self.klasses = {}
+
+    def parse(self, klasses, workers=1):
+        """Parse the unique source files of all of the classes and their ancestors.
+
+        Args:
+            klasses (list): The classes in scope, which the ancestors are found from.
+            workers (int): The number of processes to parse the files with, 1 parses them in this process.
+        """
+        paths = set()
+        for klass in klasses:
+            for ancestor in klass.__mro__:
+                path = get_source_file(ancestor)
+                if path and path not in self.sources:
+                    paths.add(path)
+        paths = sorted(paths)
+        if workers > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(get_source_attribute_code, paths, chunksize=max(1, len(paths) // workers)))
+        else:
+            results = [get_source_attribute_code(path) for path in paths]
+        self.sources.update(zip(paths, results))
+
+    def get_source_error(self, klass):
+        """Get why the definition of the class can not be found in its source file, or None when it can be.
+
+        Such as a class created with `type()` or by a factory, which can be found by the subclasses discovery.
+        """
+        path = get_source_file(klass)
+        if path and path not in self.sources:
+            self.sources[path] = get_source_attribute_code(path)
+        if path and klass.__qualname__ in (self.sources[path] or {}):
+            return None
+        try:
+            self.get_attribute_code(klass)
+        except (OSError, TypeError) as error:
+            return f"{type(error).__name__}: {error}"
+        return None
+
+    def get_attribute_code(self, klass):
+        """Get the code of the class attributes, falling back to `get_attribute_code` when not parsed already.
+
+        The result is cached per class for the life of the table, so that ancestors shared by many classes are
+        only resolved once per build.
+        """
+        if klass not in self.klasses:
+            parsed = self.sources.get(get_source_file(klass))
+            if parsed is None or klass.__qualname__ not in parsed:
+                self.klasses[klass] = get_attribute_code(klass)
+            else:
+                attributes = parsed[klass.__qualname__]
+                members = get_class_members(klass)
+                self.klasses[klass] = {name: code for name, code in attributes.items() if name in members}
+        return self.klasses[klass]
+
+
 class KlassInspector:  # pylint: disable=too-many-instance-attributes
     """Inspector object to inspect a class."""
 
-    def __init__(self, klasses, dotted_path):
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, klasses, dotted_path, method_table=None, attribute_table=None, registry=None
+    ):
         """Initialize the Class.
 
         Args:
             klasses (list): List of classes in dotted_path format.
             dotted_path (str): The class in questions dotted_path.
+            method_table (MethodTable): The methods of each class, shared between all classes of a build.
+            attribute_table (AttributeTable): The attribute code of each class, shared between all classes of a build.
+            registry (KlassRegistry): The class object of each dotted_path, shared between all classes of a build.
         """
         self.klasses = klasses
+        self.registry = registry if registry is not None else KlassRegistry()
+        self.method_table = method_table if method_table is not None else MethodTable()
+        self.attribute_table = attribute_table if attribute_table is not None else AttributeTable()
         self.klass_name = dotted_path.rsplit(".")[0]
         self.module_name = dotted_path.rsplit(".")[1]
         self.dotted_path = dotted_path
@@ -142,7 +317,7 @@ class KlassInspector:  # pylint: disable=too-many-instance-attributes
 
     def get_klass(self):
         """Load the class."""
-        return import_string(self.dotted_path)
+        return self.registry.resolve(self.dotted_path)
 
     def get_page_url(self):
         """Get the url of the class."""
@@ -151,47 +326,46 @@ class KlassInspector:  # pylint: disable=too-many-instance-attributes
     def get_klass_mro(self):
         """Get the class inheritance order or MRO."""
         ancestors = []
-        for ancestor in self.get_klass().mro():
+        for ancestor in self.registry.get_mro(self.dotted_path):
             if ancestor is object:
                 break
             ancestors.append(ancestor)
             if not self.klass_code.get(get_dotted_path(ancestor)):
-                self.klass_code[get_dotted_path(ancestor)] = get_attribute_code(
-                    import_string(get_dotted_path(ancestor))
-                )
+                self.klass_code[get_dotted_path(ancestor)] = self.attribute_table.get_attribute_code(ancestor)
         return ancestors
 
     def get_children(self):
         """Get children."""
         children = []
-        for klass in self.klasses:
-            klass = import_string(klass)
-            if issubclass(klass, self.get_klass()) and klass != self.get_klass():
+        parent = self.get_klass()
+        # Sorted, so the order does not depend on the order in which the classes were discovered.
+        for klass in sorted(self.klasses):
+            klass = self.registry.resolve(klass)
+            if klass is not None and issubclass(klass, parent) and klass != parent:
                 children.append(klass)
         return children
 
-    def _is_method(self, attr):
-        return isinstance(attr, (types.FunctionType, types.MethodType))
-
     def get_attributes(self):
         """Get the attributes of the class."""
         attrs = Attributes()
         attr_dict = {}
         sorted_dict = {}
+        instance_class = self.get_klass()
 
         for klass in self.get_klass_mro():
             attr_info = self.klass_code[get_dotted_path(klass)]
 
             for attr_str, code in attr_info.items():
                 val = Attribute(
-                    name=attr_str, value=attr_str, classobject=klass, instance_class=self.get_klass(), attr_code=code
+                    name=attr_str, value=attr_str, classobject=klass, instance_class=instance_class, attr_code=code
                 )
                 if not val.attr_code:
                     continue
                 if not sorted_dict.get(attr_str):
                     sorted_dict[attr_str] = []
-                sorted_dict[attr_str].append(str(klass.__name__))
-                attr_dict[f"{str(klass.__name__)}___{attr_str}"] = val
+                # Keyed by dotted_path, as classes in the MRO can share the same name.
+                sorted_dict[attr_str].append(get_dotted_path(klass))
+                attr_dict[f"{get_dotted_path(klass)}___{attr_str}"] = val
         attrs = []
         # The ordering of the attributes should be printed out in alpha, then mro order.
         # MRO order is kept with the list of the lists created in `sorted_dict` and we simply
@@ -202,33 +376,63 @@ class KlassInspector:  # pylint: disable=too-many-instance-attributes
         return attrs
 
     def get_methods(self):
-        """Get the callable methods."""
-        attrs = Attributes()
-
+        """Get the callable methods, sorted by name, with any overridden implementation as children."""
+        methods = {}
+        instance_class = self.get_klass()
         for klass in self.get_klass_mro():
-            for attr_str in klass.__dict__.keys():
-                if attr_str.startswith("__") and not attr_str.startswith("__init__"):
-                    continue
-                # Occasionally you will get an attribute that is a assigned to a function
-                # such as `objects = RestrictedQuerySet.as_manager()`, when this happens ensure it did
-                # not fail on a method in which you would re-raise the same issue, otherwise continue on.
-                try:
-                    attr = getattr(klass, attr_str)
-                except Exception:
-                    if not is_function_attribute(klass, attr_str):
-                        continue
-                    raise
-                if self._is_method(attr):
-                    attrs.append(
-                        Method(
-                            name=attr_str,
-                            value=attr,
-                            classobject=klass,
-                            instance_class=self.get_klass(),
-                            attr_code=None,
-                        )
-                    )
-        return attrs
+            for attr_str, attr in self.method_table.get_defined_methods(klass):
+                method = Method(
+                    name=attr_str,
+                    value=attr,
+                    classobject=klass,
+                    instance_class=instance_class,
+                    attr_code=None,
+                )
+                if attr_str in methods:
+                    methods[attr_str].children.append(method)
+                else:
+                    methods[attr_str] = method
+        return [methods[attr_str] for attr_str in sorted(methods)]
+
+    def get_data(self):
+        """Get all of the data required to render the class, in a format that can be serialized to json."""
+        return {
+            "ancestors": [
+                {"name": ancestor.__name__, "dotted_path": get_dotted_path(ancestor)}
+                for ancestor in self.get_klass_mro()
+            ],
+            "descendants": [
+                {"name": descendant.__name__, "dotted_path": get_dotted_path(descendant)}
+                for descendant in self.get_children()
+            ],
+            "attributes": [
+                {
+                    "name": attribute.name,
+                    "attr_code": attribute.attr_code,
+                    "defined_in": attribute.classobject.__name__,
+                    "defined_in_path": get_dotted_path(attribute.classobject),
+                }
+                for attribute in self.get_attributes()
+            ],
+            "methods": [
+                {
+                    "name": method.name,
+                    "params": method.params_string(),
+                    "defined_in": method.classobject.__name__,
+                    "implementations": [
+                        {
+                            "defined_in": child.classobject.__name__,
+                            "defined_in_path": get_dotted_path(child.classobject),
+                            "params": child.params_string(),
+                            "line_number": child.line_number(),
+                            "code": child.code(),
+                        }
+                        for child in [method] + method.children
+                    ],
+                }
+                for method in self.get_methods()
+            ],
+        }
 
     def get_direct_ancestors(self):
         """Filter for only the direct ancestors."""
@@ -274,7 +478,9 @@ class KlassInspector:  # pylint: disable=too-many-instance-attributes
 class Inspector:  # pylint: disable=too-many-instance-attributes
     """Inspector Class aggregates all of the relevant KlassInspector instances."""
 
-    def __init__(self, strategy, base_classes_str, module_info, urls, libraries):  # pylint: disable=too-many-arguments
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, strategy, base_classes_str, module_info, urls, libraries, workers=1, pages=None, discovery="modules"
+    ):
         """Initialize the Class.
 
         Args:
@@ -283,26 +489,68 @@ class Inspector:  # pylint: disable=too-many-instance-attributes
             module_info (list): The list of modules to check for the base class from.
             urls (dict): The urls associated with all of the classes.
             libraries (list): A list of library paths to be interested in.
+            workers (int): The number of processes used to parse the source files of the classes.
+            pages (list): Only parse the source files for the classes of these pages, None for all pages. The
+                subclasses discovery parses the source files of all of the classes it finds, to check their source.
+            discovery (str): Either `modules` to scan the attributes of each module, or `subclasses` to walk the
+                subclasses of each base class, which is only supported by the subclass strategy.
         """
         self.strategy = strategy
         self.base_classes_str = base_classes_str
-        self.base_classes = [(i, import_string(i)) for i in base_classes_str]
+        # Resolves every class only once, a class or module that fails to import is reported instead of raised.
+        self.registry = KlassRegistry()
+        self.failures = self.registry.failures
+        self.base_classes = [(i, self.registry.resolve(i)) for i in base_classes_str]
+        self.base_classes = [i for i in self.base_classes if i[1] is not None]
         self.base_classes_tuple = tuple(i[1] for i in self.base_classes)
         self.modules_str = list(module_info)
         self.urls = urls
         self.libraries = libraries
         self.klasses = {}
-        self.get_all_klasses()
+        self.method_table = MethodTable()
+        self.attribute_table = AttributeTable()
+        if discovery == "subclasses":
+            self.get_subclass_klasses(workers)
+        else:
+            self.get_all_klasses()
         self.klass_details = {}
         self.klass_short = {}
+        self.attribute_table.parse(
+            [
+                self.registry.resolve(klass)
+                for klass, value in self.klasses.items()
+                if pages is None or value["subclass_path"] in pages
+            ],
+            workers=workers,
+        )
         for klass in self.klasses:
-            self.klass_details[klass] = KlassInspector(self.klasses, klass)
+            self.klass_details[klass] = KlassInspector(
+                self.klasses, klass, self.method_table, self.attribute_table, self.registry
+            )
             self.klass_short[klass] = self.klass_details[klass].dotted_path
 
+    def get_klass_data(self, dotted_path):
+        """Get the data required to render a class, see `KlassInspector.get_data`."""
+        return self.klass_details[dotted_path].get_data()
+
+    def get_snapshot(self):
+        """Get the inspection of all classes in a portable format, that can be rendered without importing them."""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "strategy": self.strategy,
+            "klasses": {
+                dotted_path: {"module_path": value["module_path"], "subclass_path": value["subclass_path"]}
+                for dotted_path, value in self.klasses.items()
+            },
+            "klass_details": {dotted_path: self.get_klass_data(dotted_path) for dotted_path in self.klasses},
+        }
+
     def get_all_klasses(self):
         """Dynamically find all classes in scope."""
         for module_str in self.modules_str:  # pylint: disable=too-many-nested-blocks
-            module = importlib.import_module(module_str)
+            module = self.registry.resolve_module(module_str)
+            if module is None:
+                continue
             for attr_str in dir(module):
                 attr = getattr(module, attr_str)
                 try:
@@ -314,6 +562,7 @@ class Inspector:  # pylint: disable=too-many-instance-attributes
                         if any(attr.__module__.startswith(i) for i in self.libraries):
                             url = self.get_url(module_str, base_class[0], attr.__name__)
                             if not self.klasses.get(get_dotted_path(attr)):
+                                self.registry.register(get_dotted_path(attr), attr)
                                 self.klasses[get_dotted_path(attr)] = {
                                     "module_path": module_str,
                                     "subclass_path": base_class[0],
@@ -322,6 +571,55 @@ class Inspector:  # pylint: disable=too-many-instance-attributes
                             # self.klasses_code[get_dotted_path(attr)] = get_attribute_code(import_string(get_dotted_path(attr)))
                         break
 
+    def get_subclass_klasses(self, workers=1):
+        """Find all classes in scope by walking the subclasses of each base class, instead of scanning the modules.
+
+        The modules are still imported, so the classes they define are registered as subclasses. Each class is mapped
+        to the first base class it subclasses, the same as `get_all_klasses`, but classes that are not exposed by the
+        modules are found as well. As those can include classes without a source, such as classes created with
+        `type()`, a class is only in scope when the source of it and its ancestors is found, otherwise it is recorded
+        in `failures`.
+
+        Args:
+            workers (int): The number of processes to parse the source files of the found classes with, prior to
+                checking their source.
+        """
+        if self.strategy != "subclass":
+            raise ValueError("The subclasses discovery is only supported by the subclass strategy.")
+        for module_str in self.modules_str:
+            self.registry.resolve_module(module_str)
+        libraries = get_library_pattern(self.libraries)
+        visited = set()
+        candidates = {}
+        for base_class_str, base_class in self.base_classes:
+            stack = [base_class]
+            while stack:
+                klass = stack.pop()
+                if klass in visited:
+                    continue
+                visited.add(klass)
+                # Called from type, so metaclasses are walked as well.
+                stack.extend(type.__subclasses__(klass))
+                if klass.__name__.startswith("_") or not libraries.match(klass.__module__):
+                    continue
+                dotted_path = get_dotted_path(klass)
+                if dotted_path not in self.failures:
+                    candidates.setdefault(dotted_path, (klass, base_class_str))
+        # Parsed in one go, so the source check only looks up the parsed files and `workers` still applies.
+        self.attribute_table.parse([klass for klass, _ in candidates.values()], workers=workers)
+        for dotted_path, (klass, base_class_str) in candidates.items():
+            errors = ((i, self.attribute_table.get_source_error(i)) for i in klass.__mro__[:-1])
+            missing = next((i for i in errors if i[1]), None)
+            if missing:
+                self.failures[dotted_path] = f"The source of {get_dotted_path(missing[0])} was not found, {missing[1]}"
+            else:
+                self.registry.register(dotted_path, klass)
+                self.klasses[dotted_path] = {
+                    "module_path": klass.__module__,
+                    "subclass_path": base_class_str,
+                    "url": self.get_url(klass.__module__, base_class_str, klass.__name__),
+                }
+
     def get_url(self, module_str, base_class_str, name):
         """Toggle the url based on the strategy."""
         if self.strategy == "subclass":
@@ -329,3 +627,52 @@ class Inspector:  # pylint: disable=too-many-instance-attributes
         if self.strategy == "module":
             return self.urls[module_str] + f"#{name.lower()}"
         raise ValueError("Strategy not one of ('subclass', 'module').")
+
+
+class SnapshotInspector:  # pylint: disable=too-few-public-methods
+    """Inspector Class that serves the data of a snapshot, without importing any of the classes."""
+
+    def __init__(self, snapshot, urls):
+        """Initialize the Class.
+
+        Args:
+            snapshot (dict): The snapshot as created by `Inspector.get_snapshot`.
+            urls (dict): The urls associated with all of the classes.
+        """
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Snapshot version {snapshot.get('version')} is not supported, expected {SNAPSHOT_VERSION}."
+            )
+        self.strategy = snapshot["strategy"]
+        self.urls = urls
+        self.klasses = {}
+        self.klass_details = snapshot["klass_details"]
+        self.klass_short = {}
+        self.failures = {}
+        for dotted_path, value in snapshot["klasses"].items():
+            url = get_url_from_strategy(
+                value["module_path"], value["subclass_path"], urls, self.strategy, dotted_path.rsplit(".", 1)[1]
+            )
+            if url is None:
+                # The page was removed or renamed since the snapshot was created.
+                page = value["subclass_path"] if self.strategy == "subclass" else value["module_path"]
+                self.failures[dotted_path] = (
+                    f"The page of {page} is not in the docs, the snapshot is stale, "
+                    "recreate it with `mkdocs-classy inspect`."
+                )
+                continue
+            self.klasses[dotted_path] = {
+                "module_path": value["module_path"],
+                "subclass_path": value["subclass_path"],
+                "url": url,
+            }
+            self.klass_short[dotted_path] = dotted_path
+
+    def get_klass_data(self, dotted_path):
+        """Get the data required to render a class, see `KlassInspector.get_data`.
+
+        The descendants without a page, which were dropped from a stale snapshot, are left out.
+        """
+        data = self.klass_details[dotted_path]
+        descendants = [i for i in data["descendants"] if i["dotted_path"] in self.klasses]
+        return dict(data, descendants=descendants)
@@ -0,0 +1,234 @@
+"""Functions to render the inspected data of a class into markdown, or directly into html."""
+from html import escape
+
+from mkdocs_python_classy.utils import relative_path
+
+
+def get_shared_anchor(name):
+    """Get the anchor of the shared section of a class, following the default heading slug."""
+    return f"{name.lower()}-shared-members"
+
+
+def get_ancestor_path(ancestor, urls, current_url, path_short_map):
+    """Get the relative path to the section of an ancestor, or None when it does not have a page."""
+    module_path = ancestor["dotted_path"]
+    if urls.get(module_path):
+        return relative_path(urls[module_path]["url"], current_url)
+    if urls.get(path_short_map.get(ancestor["name"])):
+        return relative_path(urls[path_short_map[ancestor["name"]]]["url"], current_url)
+    return None
+
+
+def split_shared_members(data, shared):
+    """Split the members of a class from the ones that are rendered in the section of a shared ancestor.
+
+    Args:
+        data (dict): The data of the class, as found in `KlassInspector.get_data`.
+        shared (dict): The ancestors rendered once per page, as found in `get_shared_ancestors`.
+
+    Returns:
+        tuple: The attributes and methods to render for the class, and the shared ancestors to link to for each.
+    """
+    shared = shared or {}
+    # Matched on the dotted_path, as a class can have the same name as one of its shared ancestors.
+    shared_paths = [i["dotted_path"] for i in data["ancestors"][1:] if i["dotted_path"] in shared]
+
+    attributes = [i for i in data["attributes"] if i["defined_in_path"] not in shared_paths]
+    methods = []
+    for method in data["methods"]:
+        implementations = [i for i in method["implementations"] if i["defined_in_path"] not in shared_paths]
+        if implementations:
+            methods.append(dict(method, implementations=implementations))
+    attribute_paths = {i["defined_in_path"] for i in data["attributes"]}
+    method_paths = {impl["defined_in_path"] for method in data["methods"] for impl in method["implementations"]}
+    attribute_shared = [shared[i] for i in shared_paths if i in attribute_paths]
+    method_shared = [shared[i] for i in shared_paths if i in method_paths]
+    return attributes, methods, attribute_shared, method_shared
+
+
+def get_shared_members(dotted_path, name, datas):
+    """Get the attributes and methods defined in a shared ancestor, across all of the classes on the page.
+
+    Args:
+        dotted_path (str): The dotted_path of the shared ancestor.
+        name (str): The name of the shared ancestor.
+        datas (dict): The data of each class on the page, as found in `KlassInspector.get_data`.
+    """
+    attributes = {}
+    methods = {}
+    for data in datas.values():
+        if dotted_path not in [i["dotted_path"] for i in data["ancestors"]]:
+            continue
+        for attribute in data["attributes"]:
+            if attribute["defined_in_path"] == dotted_path:
+                attributes.setdefault(attribute["name"], attribute)
+        for method in data["methods"]:
+            for implementation in method["implementations"]:
+                if implementation["defined_in_path"] == dotted_path:
+                    methods.setdefault(
+                        method["name"],
+                        {
+                            "name": method["name"],
+                            "params": implementation["params"],
+                            "defined_in": name,
+                            "implementations": [implementation],
+                        },
+                    )
+    return [attributes[i] for i in sorted(attributes)], [methods[i] for i in sorted(methods)]
+
+
+def render_ancestors(ancestors, urls, current_url, path_short_map):
+    """Render the MRO as an ordered list, linking to the ancestors that have a page."""
+    _out = f"1. {ancestors[0]['name']}\n"
+
+    for ancestor in ancestors[1:]:
+        name = ancestor["name"]
+        path = get_ancestor_path(ancestor, urls, current_url, path_short_map)
+        if path:
+            _out += f"1. [{name}]({path})\n"
+        else:
+            _out += f"1. {name}\n"
+    return _out
+
+
+def render_descendants(descendants, urls, current_url, name):
+    """Render the list of descendant classes."""
+    if not descendants:
+        return ""
+    _out = f"The below Classes rely on: `{name}`.\n\n"
+    for descendant in descendants:
+        module_path = descendant["dotted_path"]
+        _out += f"- [{descendant['name']}]({relative_path(urls[module_path]['url'], current_url)})\n"
+    return _out
+
+
+def render_attributes(attributes):
+    """Render the attributes as a table, striking through the ones overridden further down the MRO."""
+    if not attributes:
+        return "No attributes in `{{ this_module }}.{{ name }}`"
+    _out = "| Key | Value | Defined in |\n"
+    _out += "| :-- | :---- | :--------- |\n"
+    previous_name = None
+    for attribute in attributes:
+        name = attribute["name"]
+        if previous_name == attribute["name"]:
+            name = f"~~{name}~~"
+        _out += f"{name} | `{attribute['attr_code']}` | {attribute['defined_in']} |\n"
+        previous_name = attribute["name"]
+
+    return _out
+
+
+def render_methods(methods, badges):
+    """Render each method as a collapsed admonition, with the code of every implementation in the MRO.
+
+    Args:
+        methods (list): The methods, as found in `KlassInspector.get_data`.
+        badges (list): Collects the "defined in" badges of each method, in the order they are rendered.
+    """
+    _out = ""
+    for method in methods:
+        _out += f"""??? quote "`def {method['name']}({method['params']}):`"\n"""
+        badges.append(method["defined_in"])
+        _out += "    \n"
+        children = method["implementations"]
+        for child in children:
+            if len(children) != 1:
+                _out += "    \n"
+                _out += f"    **{child['defined_in']}**\n"
+            _out += "    \n"
+            _out += f'    ``` py linenums="{child["line_number"]}"\n'
+            _out += "    \n"
+            for line in child["code"].splitlines():
+                _out += f"    {line}\n"
+            _out += "    ```\n"
+        _out += "\n"
+    return _out
+
+
+def render_shared_links(shared_ancestors, kind):
+    """Render the links to the sections that hold the members inherited from shared ancestors.
+
+    Args:
+        shared_ancestors (list): The name and anchor of each shared ancestor, in MRO order.
+        kind (str): Either attributes or methods.
+    """
+    if not shared_ancestors:
+        return ""
+    links = ", ".join(f"[{i['name']}](#{i['anchor']})" for i in shared_ancestors)
+    return f"\n\nThe {kind} inherited from shared ancestors are found in: {links}\n"
+
+
+def _text(value):
+    return escape(str(value), quote=False)
+
+
+def render_ancestors_html(ancestors, urls, current_url, path_short_map):
+    """Render the MRO as html, the same as `render_ancestors` once converted."""
+    _out = f"<ol>\n<li>{_text(ancestors[0]['name'])}</li>\n"
+    for ancestor in ancestors[1:]:
+        path = get_ancestor_path(ancestor, urls, current_url, path_short_map)
+        if path:
+            _out += f'<li><a href="{escape(path)}">{_text(ancestor["name"])}</a></li>\n'
+        else:
+            _out += f"<li>{_text(ancestor['name'])}</li>\n"
+    return _out + "</ol>\n"
+
+
+def render_descendants_html(descendants, urls, current_url, name):
+    """Render the list of descendant classes as html, the same as `render_descendants` once converted."""
+    if not descendants:
+        return ""
+    _out = f"<p>The below Classes rely on: <code>{_text(name)}</code>.</p>\n<ul>\n"
+    for descendant in descendants:
+        path = relative_path(urls[descendant["dotted_path"]]["url"], current_url)
+        _out += f'<li><a href="{escape(path)}">{_text(descendant["name"])}</a></li>\n'
+    return _out + "</ul>\n"
+
+
+def render_attributes_html(attributes):
+    """Render the attributes as an html table, the same as `render_attributes` once converted."""
+    if not attributes:
+        return "<p>No attributes in <code>{{ this_module }}.{{ name }}</code></p>\n"
+    cell = '<td style="text-align: left;">'
+    headers = "".join(f'<th style="text-align: left;">{header}</th>\n' for header in ("Key", "Value", "Defined in"))
+    _out = f"<table>\n<thead>\n<tr>\n{headers}</tr>\n</thead>\n<tbody>\n"
+    previous_name = None
+    for attribute in attributes:
+        name = _text(attribute["name"])
+        if previous_name == attribute["name"]:
+            name = f"<del>{name}</del>"
+        _out += f"<tr>\n{cell}{name}</td>\n"
+        _out += f"{cell}<code>{_text(attribute['attr_code'])}</code></td>\n"
+        _out += f"{cell}{_text(attribute['defined_in'])}</td>\n</tr>\n"
+        previous_name = attribute["name"]
+    return _out + "</tbody>\n</table>\n"
+
+
+def render_methods_html(methods, highlight):
+    """Render each method as html, the same as `render_methods` once converted.
+
+    Args:
+        methods (list): The methods, as found in `KlassInspector.get_data`.
+        highlight (callable): Highlights python code, given the code and the starting line number.
+    """
+    _out = ""
+    for method in methods:
+        _out += '<details class="quote">\n'
+        _out += f"<summary><code>def {_text(method['name'])}({_text(method['params'])}):</code> "
+        _out += f'<small class="pull-right">{_text(method["defined_in"])}</small></summary>\n'
+        children = method["implementations"]
+        for child in children:
+            if len(children) != 1:
+                _out += f"<p><strong>{_text(child['defined_in'])}</strong></p>\n"
+            _out += highlight(child["code"], child["line_number"]) + "\n"
+        _out += "</details>\n"
+    return _out
+
+
+def render_shared_links_html(shared_ancestors, kind):
+    """Render the links to the shared sections as html, the same as `render_shared_links` once converted."""
+    if not shared_ancestors:
+        return ""
+    links = ", ".join(f'<a href="#{escape(i["anchor"])}">{_text(i["name"])}</a>' for i in shared_ancestors)
+    return f"<p>The {kind} inherited from shared ancestors are found in: {links}</p>\n"
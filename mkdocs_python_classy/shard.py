@@ -0,0 +1,104 @@
+"""Functions to split the classy pages across multiple builds, and merge the resulting sites."""
+import hashlib
+import json
+import os
+import shutil
+
+from mkdocs_python_classy.constants import MANIFEST_FILENAME, SHARD_MANIFEST_FILENAME
+
+
+def parse_shard(value):
+    """Parse a shard in `i/n` format, where `i` starts at 1, and return the (index, count) tuple."""
+    try:
+        index, count = (int(i) for i in value.split("/"))
+    except ValueError as exc:
+        raise ValueError(f"The shard {value} is not in the `i/n` format, such as `1/4`.") from exc
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"The shard {value} must be between 1 and the number of shards.")
+    return index, count
+
+
+def get_shard(dotted_path, count):
+    """Get the shard (starting at 1) of a classy page, which stays the same when other pages are added or removed."""
+    return int(hashlib.sha256(dotted_path.encode("utf-8")).hexdigest(), 16) % count + 1
+
+
+def _load_json(path):
+    with open(path, encoding="utf-8") as the_file:
+        return json.load(the_file)
+
+
+def _write_json(path, data, **kwargs):
+    with open(path, "w", encoding="utf-8") as the_file:
+        json.dump(data, the_file, **kwargs)
+
+
+def _page_url(location):
+    """Get the page url of a search index location, such as `classy/views/` from `classy/views/#listview`."""
+    return location.split("#")[0]
+
+
+def merge_shards(shard_dirs, output):
+    """Merge the site_dir of each shard into a single site.
+
+    The site of the first shard is used as the base, the pages rendered by each shard are then copied over it, and
+    the search index as well as the content hash manifest are combined. Links between pages do not need to be
+    updated, as each shard discovers all of the classes.
+
+    Args:
+        shard_dirs (list): The site_dir of every shard, in any order.
+        output (str): The directory to write the merged site to.
+    """
+    manifests = {}
+    for shard_dir in shard_dirs:
+        manifest = _load_json(os.path.join(shard_dir, SHARD_MANIFEST_FILENAME))
+        manifests[shard_dir] = manifest
+    counts = {manifest["shards"] for manifest in manifests.values()}
+    shards = sorted(manifest["shard"] for manifest in manifests.values())
+    if len(counts) != 1 or shards != list(range(1, counts.pop() + 1)):
+        raise ValueError(f"Expected exactly one site_dir per shard, found the shards {shards}.")
+    shard_dirs = sorted(shard_dirs, key=lambda shard_dir: manifests[shard_dir]["shard"])
+
+    shutil.copytree(shard_dirs[0], output, dirs_exist_ok=True)
+    owners = {}
+    for shard_dir in shard_dirs:
+        for dest_uri, url in manifests[shard_dir]["pages"].items():
+            shutil.copy2(os.path.join(shard_dir, dest_uri), os.path.join(output, dest_uri))
+            owners[url] = shard_dir
+    os.remove(os.path.join(output, SHARD_MANIFEST_FILENAME))
+
+    _merge_search_index(shard_dirs, output, owners)
+    _merge_hash_manifest(shard_dirs, output, manifests)
+
+
+def _merge_search_index(shard_dirs, output, owners):
+    """Replace the entries of each page in the search index, with the entries of the shard that rendered it."""
+    search_index = os.path.join("search", "search_index.json")
+    if not os.path.isfile(os.path.join(output, search_index)):
+        return
+    indexes = {shard_dir: _load_json(os.path.join(shard_dir, search_index)) for shard_dir in shard_dirs}
+    merged = indexes[shard_dirs[0]]
+    docs = []
+    seen = set()
+    for doc in merged["docs"]:
+        url = _page_url(doc["location"])
+        if url not in owners:
+            docs.append(doc)
+        elif url not in seen:
+            seen.add(url)
+            docs.extend(i for i in indexes[owners[url]]["docs"] if _page_url(i["location"]) == url)
+    merged["docs"] = docs
+    # A prebuilt index would no longer match the docs, the browser builds it when it is missing.
+    merged.pop("index", None)
+    _write_json(os.path.join(output, search_index), merged, separators=(",", ":"))
+
+
+def _merge_hash_manifest(shard_dirs, output, manifests):
+    """Combine the content hash manifest, taking the entry of each page from the shard that rendered it."""
+    if not os.path.isfile(os.path.join(shard_dirs[0], MANIFEST_FILENAME)):
+        return
+    merged = _load_json(os.path.join(shard_dirs[0], MANIFEST_FILENAME))
+    for shard_dir in shard_dirs[1:]:
+        hashes = _load_json(os.path.join(shard_dir, MANIFEST_FILENAME))
+        merged.update({i: hashes[i] for i in manifests[shard_dir]["pages"] if i in hashes})
+    _write_json(os.path.join(output, MANIFEST_FILENAME), merged, indent=2, sort_keys=True)
@@ -1,10 +1,17 @@
 """Set of utility functions for the mkdocs plugin."""
 import ast
+import contextlib
+import hashlib
 import importlib
 import inspect
 import os
+import re
+import signal
 import sys
-import types
+import textwrap
+import threading
+import time
+import tokenize
 
 if sys.version_info < (3, 9):
     # ast.unparse only supported as of 3.9
@@ -17,6 +24,49 @@ if sys.version_info < (3, 9):
     ast.unparse = _unparse
 
 
+class BudgetExceeded(BaseException):
+    """Raised when the inspection or rendering of a class exceeds its time budget.
+
+    Derived from BaseException, as the alarm can fire within any code, such as a descriptor or the `except Exception`
+    of the inspection, which would otherwise swallow it and leave the rest of the class without a budget.
+    """
+
+
+@contextlib.contextmanager
+def time_budget(seconds):
+    """Raise `BudgetExceeded` when the block runs for longer than the budget, a budget of None disables it.
+
+    Where SIGALRM is available (posix, in the main thread) the block is interrupted, otherwise the exception is
+    raised once the block completes. Budgets can not be nested, as there is a single alarm.
+    """
+    if seconds is None:
+        yield
+        return
+    if seconds <= 0:
+        raise BudgetExceeded("No time left from the budget.")
+
+    def _handler(signum, frame):  # pylint: disable=unused-argument
+        raise BudgetExceeded(f"Exceeded the budget of {seconds:.2f} seconds.")
+
+    use_alarm = hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+    start = time.perf_counter()
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _handler)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        try:
+            yield
+        finally:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    finally:
+        # Restored even when the alarm goes off while it is being disarmed, so `_handler` is never left installed.
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous)
+    if time.perf_counter() - start > seconds:
+        raise BudgetExceeded(f"Exceeded the budget of {seconds:.2f} seconds.")
+
+
 def determine_klass_found(attr, elements):
     """Determine not only that a subclass was found, but which one matched."""
     for index, element in enumerate(elements):
@@ -67,56 +117,124 @@ def is_function_attribute(cls, attr_name):
     return visitor.is_function_attr
 
 
-def get_attribute_code(cls):
-    """Function that gets the actual code via ast of the class attributes."""
+def get_class_members(cls):
+    """Get the names that are set on the class itself, used to filter the assignments found in its body.
 
-    class StopTreeTraversal(Exception):
-        """Custom exception to stop tree traversal."""
+    Besides the `__dict__`, this includes the annotated fields, which dataclasses with a `default_factory` and
+    pydantic models remove from the `__dict__` of the class.
+    """
+    members = set(cls.__dict__)
+    members.update(cls.__dict__.get("__annotations__", {}))
+    members.update(getattr(cls, "__dataclass_fields__", {}))
+    return members
 
-    class ClassAttributeVisitor(ast.NodeVisitor):
-        """Overwrite the ast class, to only check the `visit_Assign` method."""
 
-        def __init__(self):
-            """Initialiaze the class and assign variables."""
-            self.class_attributes = {}
-            self.class_members = [name for name, _ in _getmembers_static(cls)]
+class _ClassBodyVisitor(ast.NodeVisitor):
+    """Visit the statements of a class body, without descending into nested functions or classes."""
 
-        def visit_Assign(self, node):  # pylint: disable=invalid-name
-            """Method that we care to overwrite, looking to ensure only looking at assignment on the class."""
-            # Once all of the class attributes have been exhausted, we don't need to
-            # continute with the walk any further
-            if not self.class_members:
-                raise StopTreeTraversal()
-            for target in node.targets:
-                if (
-                    isinstance(target, ast.Attribute)
-                    and isinstance(target.value, ast.Name)
-                    and target.value.id == "self"
-                ):
-                    # This is an instance attribute, not a class attribute
-                    pass
-                else:
-                    if isinstance(target, ast.Name) and target.id in self.class_members:
-                        attr_name = target.id
-                        attr_code = ast.unparse(node.value)
-                        self.class_attributes[attr_name] = attr_code
-                        self.class_members.remove(attr_name)
+    def __init__(self, members):
+        """Initialize the visitor.
 
-    source_code = inspect.getsource(cls)
+        Args:
+            members (set): The names set on the class, as found in `get_class_members`, used to only keep names
+                that are actually set on the class, when None all names are kept.
+        """
+        self.members = members
+        self.class_attributes = {}
+
+    def _add(self, target, value):
+        if value is None:
+            # A bare annotation, such as `name: str`, does not assign anything to the class.
+            return
+        if isinstance(target, ast.Name) and (self.members is None or target.id in self.members):
+            self.class_attributes[target.id] = ast.unparse(value)
+
+    def visit_Assign(self, node):  # pylint: disable=invalid-name
+        """Keep the assignment to any name found on the class, the last assignment wins as it would at runtime."""
+        for target in node.targets:
+            self._add(target, node.value)
+
+    def visit_AnnAssign(self, node):  # pylint: disable=invalid-name
+        """Keep annotated assignments, which are common in dataclasses and pydantic models."""
+        self._add(node.target, node.value)
+
+    def visit_FunctionDef(self, node):  # pylint: disable=invalid-name
+        """Assignments within methods are not class attributes."""
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_ClassDef = visit_FunctionDef
+    visit_Lambda = visit_FunctionDef
+
+
+def get_attribute_code(cls):
+    """Function that gets the actual code via ast of the class attributes."""
+    source_code = textwrap.dedent(inspect.getsource(cls))
     tree = ast.parse(source_code)
-    try:
-        visitor = ClassAttributeVisitor()
-        visitor.visit(tree)
-    except StopTreeTraversal:
-        pass
+    klass_node = next(node for node in tree.body if isinstance(node, ast.ClassDef))
+    visitor = _ClassBodyVisitor(get_class_members(cls))
+    for node in klass_node.body:
+        visitor.visit(node)
     return visitor.class_attributes
 
 
+def get_source_attribute_code(path):
+    """Get the code of the class attributes of every class defined in a source file, keyed by `__qualname__`.
+
+    Only requires the path, so it can be ran in a separate process. The attributes are not filtered on the
+    `__dict__` of each class, which is left to the caller. Returns None when the file can not be parsed.
+    """
+    try:
+        with tokenize.open(path) as the_file:
+            tree = ast.parse(the_file.read())
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return None
+
+    klasses = {}
+
+    def _walk(body, prefix):
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                qualname = prefix + node.name
+                visitor = _ClassBodyVisitor(None)
+                for child in node.body:
+                    visitor.visit(child)
+                klasses[qualname] = visitor.class_attributes
+                _walk(node.body, qualname + ".")
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                _walk(node.body, prefix + node.name + ".<locals>.")
+            elif isinstance(node, (ast.If, ast.Try, ast.With, ast.AsyncWith, ast.For, ast.AsyncFor, ast.While)):
+                # Classes defined conditionally, such as within `if TYPE_CHECKING:` or `try: ... except ImportError:`
+                for field in ("body", "orelse", "finalbody"):
+                    _walk(getattr(node, field, []), prefix)
+                for handler in getattr(node, "handlers", []):
+                    _walk(handler.body, prefix)
+
+    _walk(tree.body, "")
+    return klasses
+
+
+def get_source_file(cls):
+    """Get the source file of a class, or None when it does not have one, such as builtins."""
+    try:
+        return inspect.getsourcefile(cls)
+    except TypeError:
+        return None
+
+
 def get_dotted_path(obj):
     """Simple method to get the dotted_path given an object."""
     return obj.__module__ + "." + obj.__name__
 
 
+def get_file_hash(path):
+    """Get the sha256 hash of the content of a file."""
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as the_file:
+        for chunk in iter(lambda: the_file.read(65536), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
 def get_url_from_strategy(module_path, subclass_path, urls, strategy, name):
     """Toggle what is interesting in url based on strategy and add anchor to url."""
     if strategy == "subclass":
@@ -143,45 +261,9 @@ def verify_in_interesting_library(klass, libraries):
     return None
 
 
-def _getmembers_static(object, predicate=None):  # pylint: disable=redefined-builtin,too-many-branches
-    """This is a vendored approach to _getmembers_static that came in py3.11."""
-    if inspect.isclass(object):
-        mro = (object,) + inspect.getmro(object)
-    else:
-        mro = ()
-    results = []
-    processed = set()
-    names = dir(object)
-    # :dd any DynamicClassAttributes to the list of names if object is a class;
-    # this may result in duplicate entries if, for example, a virtual
-    # attribute with the same name as a DynamicClassAttribute exists
-    try:
-        for base in object.__bases__:
-            for key, val in base.__dict__.items():
-                if isinstance(val, types.DynamicClassAttribute):
-                    names.append(key)
-    except AttributeError:
-        pass
-    for key in names:
-        # First try to get the value via getattr.  Some descriptors don't
-        # like calling their __get__ (see bug #1785), so fall back to
-        # looking in the __dict__.
-        try:
-            value = inspect.getattr_static(object, key)
-            # handle the duplicate key
-            if key in processed:
-                raise AttributeError
-        except AttributeError:
-            for base in mro:
-                if key in base.__dict__:
-                    value = base.__dict__[key]
-                    break
-            else:
-                # could be a (currently) missing slot member, or a buggy
-                # __dir__; discard and move on
-                continue
-        if not predicate or predicate(value):
-            results.append((key, value))
-        processed.add(key)
-    results.sort(key=lambda pair: pair[0])
-    return results
+def get_library_pattern(libraries):
+    """Compile the prefixes of the interesting libraries into a single pattern, to match a `__module__` against."""
+    if not libraries:
+        # Matches nothing, the same as `verify_in_interesting_library` with no libraries.
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(i) for i in sorted(libraries, key=len, reverse=True)))
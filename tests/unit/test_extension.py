@@ -0,0 +1,53 @@
+"""Tests for the markdown extension."""
+import re
+import unittest
+
+from markdown import Markdown
+
+from mkdocs_python_classy.extension import ClassyExtension
+from mkdocs_python_classy.render import render_methods
+
+BADGE_RE = re.compile(r'<summary><code>def (\w+)\(self\):</code> <small class="pull-right">(\w+)</small></summary>')
+
+
+def _method(name, *defined_in):
+    return {
+        "name": name,
+        "params": "self",
+        "defined_in": defined_in[0],
+        "implementations": [
+            {"defined_in": i, "params": "self", "line_number": 1, "code": f"def {name}(self):\n    pass\n"}
+            for i in defined_in
+        ],
+    }
+
+
+class TestClassyBadgeTreeprocessor(unittest.TestCase):
+    """Test the badges added by `ClassyBadgeTreeprocessor`."""
+
+    def setUp(self):
+        """Create a Markdown instance with the extensions the plugin adds."""
+        self.extension = ClassyExtension()
+        self.md = Markdown(extensions=["tables", "pymdownx.details", "pymdownx.superfences", self.extension])
+
+    def test_badges_in_order(self):
+        """Verify that each method, of the classes and the shared sections, gets the badge of its own class."""
+        badges = []
+        page = "## `Child`\n\n**Methods**\n\n"
+        page += render_methods([_method("clean", "Child", "Base"), _method("run", "Mixin")], badges)
+        page += '??? note "Not a method"\n    Not classy markup.\n\n'
+        page += "## `Base` Shared Members\n\n**Methods**\n\n"
+        page += render_methods([_method("helper", "Base")], badges)
+        self.extension.set_badges(badges)
+        html = self.md.convert(page)
+        self.assertEqual(BADGE_RE.findall(html), [("clean", "Child"), ("run", "Mixin"), ("helper", "Base")])
+        self.assertEqual(html.count('class="pull-right"'), 3)
+        self.assertEqual(len(self.extension.badges), 0)
+
+    def test_non_classy_page(self):
+        """Verify that a page without badges, which is any page not generated by classy, is left unchanged."""
+        page = '??? quote "`def clean(self):`"\n    Quoted.\n'
+        expected = Markdown(extensions=["tables", "pymdownx.details", "pymdownx.superfences"]).convert(page)
+        self.extension.set_badges([])
+        self.assertEqual(self.md.convert(page), expected)
+        self.assertNotIn("pull-right", expected)
@@ -0,0 +1,201 @@
+"""Tests for the inspector."""
+import unittest
+from unittest import mock
+
+from mkdocs_python_classy.constants import SNAPSHOT_VERSION
+from mkdocs_python_classy.inspector import (
+    Attributes,
+    AttributeTable,
+    Inspector,
+    KlassRegistry,
+    Method,
+    MethodTable,
+    SnapshotInspector,
+)
+from mkdocs_python_classy.utils import get_source_file
+
+
+class Base:  # pylint: disable=too-few-public-methods
+    """Class used to test the discovery."""
+
+
+class Child(Base):  # pylint: disable=too-few-public-methods
+    """Subclass used to test the discovery."""
+
+
+class _Private(Child):  # pylint: disable=too-few-public-methods
+    """Private subclass, which should not be discovered."""
+
+
+class GrandChild(_Private):  # pylint: disable=too-few-public-methods
+    """Subclass of a private class, which should still be discovered."""
+
+
+class TestKlassRegistry(unittest.TestCase):
+    """Test the `KlassRegistry` class."""
+
+    def test_resolve_once(self):
+        """Verify that a class is imported once, and its MRO is kept."""
+        registry = KlassRegistry()
+        klass = registry.resolve("collections.OrderedDict")
+        self.assertIs(registry.resolve("collections.OrderedDict"), klass)
+        self.assertEqual(registry.get_mro("collections.OrderedDict"), klass.__mro__)
+
+    def test_failures_are_recorded(self):
+        """Verify that an import failure is recorded instead of raised."""
+        registry = KlassRegistry()
+        self.assertIsNone(registry.resolve("collections.DoesNotExist"))
+        self.assertIsNone(registry.resolve_module("does_not_exist"))
+        self.assertEqual(sorted(registry.failures), ["collections.DoesNotExist", "does_not_exist"])
+        self.assertTrue(registry.failures["does_not_exist"].startswith("ModuleNotFoundError"))
+
+
+# Generated classes are subclasses as well, but their definition is not found in the source.
+GENERATED = {"generated": type("Generated", (Base,), {"generated": True})}
+
+
+class FromGenerated(GENERATED["generated"]):  # pylint: disable=too-few-public-methods
+    """Subclass of a generated class, which can not be inspected either."""
+
+
+class TestSubclassDiscovery(unittest.TestCase):
+    """Test the `subclasses` discovery of the `Inspector` class."""
+
+    def test_subclasses(self):
+        """Verify that the subclasses are found through the subclass graph, without scanning any module."""
+        base = f"{__name__}.Base"
+        inspector = Inspector("subclass", [base], [], {base: "base/"}, [__name__], discovery="subclasses")
+        self.assertEqual(sorted(inspector.klasses), [base, f"{__name__}.Child", f"{__name__}.GrandChild"])
+        self.assertEqual(inspector.klasses[f"{__name__}.Child"]["url"], "base/#child")
+
+    def test_without_source(self):
+        """Verify that the classes without a source, or with an ancestor without one, are recorded as failures."""
+        base = f"{__name__}.Base"
+        inspector = Inspector("subclass", [base], [], {base: "base/"}, [__name__], discovery="subclasses")
+        self.assertNotIn(f"{__name__}.Generated", inspector.klasses)
+        self.assertNotIn(f"{__name__}.FromGenerated", inspector.klasses)
+        self.assertIn("could not find class definition", inspector.failures[f"{__name__}.Generated"])
+        self.assertIn(f"{__name__}.Generated", inspector.failures[f"{__name__}.FromGenerated"])
+        for dotted_path in inspector.klasses:
+            inspector.get_klass_data(dotted_path)
+
+    def test_parsed_prior_to_source_check(self):
+        """Verify that the source files are parsed in one go, prior to checking the source of each class."""
+        parse = AttributeTable.parse
+        get_source_error = AttributeTable.get_source_error
+        parsed = []
+
+        def check(table, klass):
+            parsed.append(get_source_file(klass) in table.sources)
+            return get_source_error(table, klass)
+
+        base = f"{__name__}.Base"
+        with mock.patch.object(AttributeTable, "get_source_error", autospec=True, side_effect=check):
+            with mock.patch.object(AttributeTable, "parse", autospec=True, side_effect=parse) as parse_mock:
+                Inspector("subclass", [base], [], {base: "base/"}, [__name__], workers=2, discovery="subclasses")
+        self.assertTrue(parsed)
+        self.assertTrue(all(parsed))
+        self.assertEqual(parse_mock.call_args_list[0].kwargs["workers"], 2)
+
+
+class Top:
+    """Top of the diamond used to test the methods."""
+
+    def run(self):
+        """Run."""
+
+    def clean(self):
+        """Clean."""
+
+
+class Left(Top):
+    """Left of the diamond."""
+
+    def run(self):
+        """Run."""
+
+    def left(self):
+        """Left."""
+
+
+class Right(Top):
+    """Right of the diamond."""
+
+    def run(self):
+        """Run."""
+
+    def clean(self):
+        """Clean."""
+
+
+class Bottom(Left, Right):  # pylint: disable=too-few-public-methods
+    """Bottom of the diamond."""
+
+    def run(self):
+        """Run."""
+
+
+def _legacy_methods(klass):
+    """Get the methods the way they were prior to the method table, appending each class of the MRO to `Attributes`."""
+    attrs = Attributes()
+    for ancestor in klass.__mro__[:-1]:
+        for name, attr in ancestor.__dict__.items():
+            if callable(attr) and (not name.startswith("__") or name.startswith("__init__")):
+                attrs.append(Method(name=name, value=attr, classobject=ancestor, instance_class=klass, attr_code=None))
+    return attrs
+
+
+class TestMethodTable(unittest.TestCase):
+    """Test the methods found through the `MethodTable` class."""
+
+    def test_diamond(self):
+        """Verify that the methods and their overrides follow the MRO of a diamond, the same as `Attributes` did."""
+        top = f"{__name__}.Top"
+        inspector = Inspector("subclass", [top], [], {top: "top/"}, [__name__], discovery="subclasses")
+        for klass in [Top, Left, Right, Bottom]:
+            with self.subTest(klass=klass.__name__):
+                methods = inspector.klass_details[f"{__name__}.{klass.__name__}"].get_methods()
+                expected = [
+                    (i.name, i.classobject, [child.classobject for child in i.children]) for i in _legacy_methods(klass)
+                ]
+                self.assertEqual(
+                    [(i.name, i.classobject, [child.classobject for child in i.children]) for i in methods], expected
+                )
+        self.assertEqual(
+            [(i.name, i.classobject, [child.classobject for child in i.children]) for i in _legacy_methods(Bottom)],
+            [("clean", Right, [Top]), ("left", Left, []), ("run", Bottom, [Left, Right, Top])],
+        )
+
+    def test_defined_once(self):
+        """Verify that the methods of a class are found once, and shared by all of its subclasses."""
+        table = MethodTable()
+        self.assertIs(table.get_defined_methods(Top), table.get_defined_methods(Top))
+        self.assertEqual([name for name, _ in table.get_defined_methods(Right)], ["run", "clean"])
+
+
+class TestSnapshotInspector(unittest.TestCase):
+    """Test the `SnapshotInspector` class."""
+
+    def test_stale_snapshot(self):
+        """Verify that the classes whose page was removed since the snapshot are dropped, and recorded as failures."""
+        klasses = {
+            "mylib.a.Parent": {"module_path": "mylib.a", "subclass_path": "mylib.a.Parent"},
+            "mylib.b.Removed": {"module_path": "mylib.b", "subclass_path": "mylib.b.Removed"},
+        }
+        parent = {
+            "ancestors": [{"name": "Parent", "dotted_path": "mylib.a.Parent"}],
+            "descendants": [{"name": "Removed", "dotted_path": "mylib.b.Removed"}],
+            "attributes": [],
+            "methods": [],
+        }
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "strategy": "subclass",
+            "klasses": klasses,
+            "klass_details": {"mylib.a.Parent": parent, "mylib.b.Removed": dict(parent, descendants=[])},
+        }
+        inspector = SnapshotInspector(snapshot, {"mylib.a.Parent": "a/"})
+        self.assertEqual(list(inspector.klasses), ["mylib.a.Parent"])
+        self.assertEqual(inspector.klasses["mylib.a.Parent"]["url"], "a/#parent")
+        self.assertIn("stale", inspector.failures["mylib.b.Removed"])
+        self.assertEqual(inspector.get_klass_data("mylib.a.Parent")["descendants"], [])
@@ -0,0 +1,286 @@
+"""Tests for the plugin."""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+
+from markdown import Markdown
+
+from mkdocs_python_classy import MkDocsPythonClassyPlugin, get_shared_anchor, get_shared_ancestors
+from mkdocs_python_classy.constants import MANIFEST_FILENAME, SNAPSHOT_VERSION
+from mkdocs_python_classy.inspector import Inspector, SnapshotInspector
+from mkdocs_python_classy.shard import get_shard
+
+MISSING = object()
+
+
+def _factory():
+    return []
+
+
+class Base:
+    """Class used to test the rendering."""
+
+    name = "base"
+    count: int = 1
+
+    def run(self, value, default=None):
+        """Run."""
+        return value or default
+
+    def helper(self):
+        """Help."""
+        return self.run(1) < 2
+
+    def fetch(self, key, default=MISSING, factory=_factory):
+        """Fetch, with defaults whose repr holds their memory address."""
+        return default if default is not MISSING else factory() or key
+
+
+class Mixin:  # pylint: disable=too-few-public-methods
+    """Mixin used to test the rendering."""
+
+    flag = True
+
+    def mix(self):
+        """Mix."""
+        return self.flag
+
+
+class Child(Mixin, Base):
+    """Subclass used to test the rendering."""
+
+    name = "child"
+
+    def run(self, value, default=1):
+        """Run, with a different default."""
+        return super().run(value, default)
+
+
+class Other(Base):  # pylint: disable=too-few-public-methods
+    """Second subclass, so the ancestors are shared."""
+
+    label = "<other & more>"
+
+
+def _data(*ancestors):
+    return {
+        "ancestors": [{"name": i.rsplit(".", 1)[1], "dotted_path": i} for i in ancestors],
+        "descendants": [],
+        "attributes": [],
+        "methods": [],
+    }
+
+
+class TestGetSharedAncestors(unittest.TestCase):
+    """Test the `get_shared_ancestors` function."""
+
+    def test_anchor_of_same_named_section(self):
+        """Verify that the anchor of a shared ancestor on the page follows the suffix of same named headings."""
+        datas = {
+            "mylib.forms.Form": _data("mylib.forms.Form", "mylib.zbase.Form"),
+            "mylib.forms.Other": _data("mylib.forms.Other", "mylib.zbase.Form"),
+            "mylib.zbase.Form": _data("mylib.zbase.Form"),
+        }
+        shared = get_shared_ancestors(datas)
+        self.assertEqual(shared, {"mylib.zbase.Form": {"name": "Form", "anchor": "form_1"}})
+
+    def test_anchor_of_same_named_shared_sections(self):
+        """Verify that same named shared sections, which are not on the page, each get a unique anchor."""
+        datas = {
+            "mylib.a.Child": _data("mylib.a.Child", "mylib.a.Form", "mylib.b.Form"),
+            "mylib.a.Other": _data("mylib.a.Other", "mylib.a.Form", "mylib.b.Form"),
+        }
+        shared = get_shared_ancestors(datas)
+        self.assertEqual(shared["mylib.a.Form"]["anchor"], get_shared_anchor("Form"))
+        self.assertEqual(shared["mylib.b.Form"]["anchor"], f"{get_shared_anchor('Form')}_1")
+
+    def test_skipped_classes_keep_their_heading(self):
+        """Verify that the classes without data, such as skipped classes, are accounted for in the anchors."""
+        datas = {
+            "mylib.forms.Form": _data("mylib.forms.Form", "mylib.zbase.Form"),
+            "mylib.forms.Other": _data("mylib.forms.Other", "mylib.zbase.Form"),
+            "mylib.zbase.Form": _data("mylib.zbase.Form"),
+        }
+        klasses = ["mylib.forms.Form", "mylib.forms.Other", "mylib.other.Form", "mylib.zbase.Form"]
+        shared = get_shared_ancestors(datas, klasses)
+        self.assertEqual(shared["mylib.zbase.Form"]["anchor"], "form_2")
+
+
+class TestShard(unittest.TestCase):
+    """Test the `classy_shard` option of the plugin."""
+
+    def test_shard_with_snapshot(self):
+        """Verify that only the pages of the shard are rendered, when the classes are loaded from a snapshot."""
+        urls = {f"mylib.Klass{i}": f"/klass{i}.md" for i in range(8)}
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "snapshot.json"), "w", encoding="utf-8") as the_file:
+                json.dump(
+                    {"version": SNAPSHOT_VERSION, "strategy": "subclass", "klasses": {}, "klass_details": {}}, the_file
+                )
+            plugin = MkDocsPythonClassyPlugin()
+            errors, _ = plugin.load_config(
+                {"classy_libraries": ["mylib"], "classy_snapshot": "snapshot.json", "classy_shard": "1/2"}
+            )
+            self.assertEqual(errors, [])
+            plugin.on_config({"markdown_extensions": [], "extra_css": []})
+            with mock.patch("mkdocs_python_classy.get_classy_urls", return_value=urls):
+                plugin.on_nav(None, config={"config_file_path": os.path.join(tmp, "mkdocs.yml")}, files=None)
+        self.assertIsInstance(plugin.inspector, SnapshotInspector)
+        self.assertEqual(plugin.shard_pages, {i for i in urls if get_shard(i, 2) == 1})
+        self.assertTrue(0 < len(plugin.shard_pages) < len(urls))
+
+
+class TestManifest(unittest.TestCase):
+    """Test the manifest, which restores the mtime of the generated files whose content did not change."""
+
+    old_mtime_ns = 1_000_000_000_000_000_000
+
+    def setUp(self):
+        """Create a temporary site_dir."""
+        self.tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.plugin = MkDocsPythonClassyPlugin()
+
+    def tearDown(self):
+        """Remove the temporary site_dir."""
+        self.tmp.cleanup()
+
+    def build(self, pages):
+        """Write the pages as a build would, then the manifest, and get the mtime of each page."""
+        self.plugin.on_pre_build(config={"site_dir": self.tmp.name})
+        for dest_uri, content in pages.items():
+            path = os.path.join(self.tmp.name, dest_uri)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as the_file:
+                the_file.write(content)
+            self.plugin.classy_outputs.add(dest_uri)
+        self.plugin.write_manifest(self.tmp.name)
+        return {i: os.stat(os.path.join(self.tmp.name, i)).st_mtime_ns for i in pages}
+
+    def age(self, *dest_uris):
+        """Set the mtime of the pages, and their entry in the manifest, to a time well in the past."""
+        manifest_path = os.path.join(self.tmp.name, MANIFEST_FILENAME)
+        with open(manifest_path, encoding="utf-8") as the_file:
+            manifest = json.load(the_file)
+        for dest_uri in dest_uris:
+            os.utime(os.path.join(self.tmp.name, dest_uri), ns=(self.old_mtime_ns, self.old_mtime_ns))
+            manifest[dest_uri]["mtime_ns"] = self.old_mtime_ns
+        with open(manifest_path, "w", encoding="utf-8") as the_file:
+            json.dump(manifest, the_file)
+
+    def test_unchanged_and_changed_pages(self):
+        """Verify that an unchanged page gets its previous mtime back, and a changed page keeps its new mtime."""
+        self.build({"a/index.html": "a", "b/index.html": "b"})
+        self.age("a/index.html", "b/index.html")
+        mtimes = self.build({"a/index.html": "a", "b/index.html": "b changed"})
+        self.assertEqual(mtimes["a/index.html"], self.old_mtime_ns)
+        self.assertNotEqual(mtimes["b/index.html"], self.old_mtime_ns)
+
+    def test_corrupt_manifest(self):
+        """Verify that a corrupt manifest is ignored, and replaced by a valid one."""
+        self.build({"a/index.html": "a"})
+        self.age("a/index.html")
+        with open(os.path.join(self.tmp.name, MANIFEST_FILENAME), "w", encoding="utf-8") as the_file:
+            the_file.write("{not json")
+        mtimes = self.build({"a/index.html": "a"})
+        self.assertEqual(self.plugin.previous_manifest, {})
+        self.assertNotEqual(mtimes["a/index.html"], self.old_mtime_ns)
+        with open(os.path.join(self.tmp.name, MANIFEST_FILENAME), encoding="utf-8") as the_file:
+            self.assertIn("a/index.html", json.load(the_file))
+
+
+class TestOutput(unittest.TestCase):
+    """Test the `classy_output` option of the plugin."""
+
+    base = f"{__name__}.Base"
+
+    def render(self, **plugin_config):
+        """Get the html of the page of the `Base` class, as converted by MkDocs."""
+        plugin = MkDocsPythonClassyPlugin()
+        errors, _ = plugin.load_config({"classy_libraries": [__name__], **plugin_config})
+        self.assertEqual(errors, [])
+        config = plugin.on_config({"markdown_extensions": ["toc", "tables"], "mdx_configs": {}, "extra_css": []})
+        with tempfile.TemporaryDirectory() as tmp:
+            plugin.on_pre_build(config={"site_dir": tmp})
+        plugin.inspector = Inspector("subclass", [self.base], [__name__], {self.base: "/base.md"}, [__name__])
+        page = types.SimpleNamespace(
+            meta={"classy_dotted_path": self.base},
+            file=types.SimpleNamespace(dest_uri="base/index.html"),
+            url="base/",
+        )
+        markdown = plugin.on_page_markdown("", page=page, config=config, files=None)
+        return Markdown(extensions=config["markdown_extensions"]).convert(markdown), plugin
+
+    def test_html_matches_markdown(self):
+        """Verify that the html output is the same as the converted markdown output."""
+        for deduplicate in [False, True]:
+            with self.subTest(deduplicate=deduplicate):
+                expected, _ = self.render(classy_deduplicate=deduplicate)
+                output, _ = self.render(classy_deduplicate=deduplicate, classy_output="html")
+                self.assertIn('<small class="pull-right">Child</small>', expected)
+                self.assertEqual(output, expected)
+
+    def test_reproducible(self):
+        """Verify that two builds, in separate processes, render the exact same bytes."""
+        code = f"import sys; from {__name__} import TestOutput; sys.stdout.write(TestOutput().render()[0])"
+        # The same import path as the test runner, so this module is found under the same name.
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        outputs = [
+            subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, env=env).stdout
+            for _ in range(2)
+        ]
+        self.assertIn(b"default=&lt;object object&gt;", outputs[0])
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_shared_within_budget(self):
+        """Verify that a shared section is rendered within a time budget of its own, for both outputs."""
+        klasses = {
+            i: {"module_path": "mylib.a", "subclass_path": "mylib.a.Child"} for i in ["mylib.a.Child", "mylib.a.Other"]
+        }
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "strategy": "subclass",
+            "klasses": klasses,
+            "klass_details": {i: _data(i, "mylib.base.Form") for i in klasses},
+        }
+
+        def slow(*args):  # pylint: disable=unused-argument
+            time.sleep(0.3)
+            return [], []
+
+        for output in ["markdown", "html"]:
+            with self.subTest(output=output):
+                plugin = MkDocsPythonClassyPlugin()
+                plugin.load_config({"classy_deduplicate": True, "classy_output": output, "classy_class_timeout": 0.1})
+                config = plugin.on_config({"markdown_extensions": ["toc"], "mdx_configs": {}, "extra_css": []})
+                with tempfile.TemporaryDirectory() as tmp:
+                    plugin.on_pre_build(config={"site_dir": tmp})
+                plugin.inspector = SnapshotInspector(snapshot, {"mylib.a.Child": "a/"})
+                page = types.SimpleNamespace(
+                    meta={"classy_dotted_path": "mylib.a.Child"},
+                    file=types.SimpleNamespace(dest_uri="a/index.html"),
+                    url="a/",
+                )
+                with mock.patch("mkdocs_python_classy.get_shared_members", side_effect=slow):
+                    markdown = plugin.on_page_markdown("", page=page, config=config, files=None)
+                self.assertEqual([i[0] for i in plugin.skipped_klasses], ["mylib.base.Form"])
+                self.assertIn(
+                    "## `Form` Shared Members\n\nThe members defined in `mylib.base.Form` were skipped", markdown
+                )
+                self.assertEqual(markdown.count("## `"), 3)
+
+    def test_html_within_budget(self):
+        """Verify that the html is rendered within the time budget of the class."""
+
+        def slow(*args):  # pylint: disable=unused-argument
+            time.sleep(0.3)
+            return ""
+
+        with mock.patch("mkdocs_python_classy.render_methods_html", side_effect=slow):
+            _, plugin = self.render(classy_output="html", classy_class_timeout=0.1)
+        self.assertEqual(len(plugin.skipped_klasses), 3)
@@ -0,0 +1,77 @@
+"""Tests for the render functions."""
+import unittest
+
+from mkdocs_python_classy.render import get_shared_members, split_shared_members
+
+
+def _method(name, *implementations):
+    return {
+        "name": name,
+        "params": "self",
+        "defined_in": implementations[0][0].rsplit(".", 1)[1],
+        "implementations": [
+            {
+                "defined_in": path.rsplit(".", 1)[1],
+                "defined_in_path": path,
+                "params": "self",
+                "line_number": line_number,
+                "code": f"def {name}(self):\n    pass\n",
+            }
+            for path, line_number in implementations
+        ],
+    }
+
+
+def _attribute(name, path):
+    return {"name": name, "attr_code": "1", "defined_in": path.rsplit(".", 1)[1], "defined_in_path": path}
+
+
+# A class with the same name as its shared ancestor, such as `mylib.forms.Form(mylib.base.Form)`.
+FORM_DATA = {
+    "ancestors": [
+        {"name": "Form", "dotted_path": "mylib.forms.Form"},
+        {"name": "Form", "dotted_path": "mylib.base.Form"},
+    ],
+    "descendants": [],
+    "attributes": [
+        _attribute("base_attr", "mylib.base.Form"),
+        _attribute("own_attr", "mylib.forms.Form"),
+    ],
+    "methods": [
+        _method("clean", ("mylib.forms.Form", 10), ("mylib.base.Form", 5)),
+        _method("own_method", ("mylib.forms.Form", 20)),
+    ],
+}
+
+SHARED = {"mylib.base.Form": {"name": "Form", "anchor": "form-shared-members"}}
+
+
+class TestSplitSharedMembers(unittest.TestCase):
+    """Test the `split_shared_members` function."""
+
+    def test_same_name_as_shared_ancestor(self):
+        """Verify that the members of a class are kept, when it has the same name as a shared ancestor."""
+        attributes, methods, attribute_shared, method_shared = split_shared_members(FORM_DATA, SHARED)
+        self.assertEqual([i["name"] for i in attributes], ["own_attr"])
+        self.assertEqual([i["name"] for i in methods], ["clean", "own_method"])
+        self.assertEqual([i["defined_in_path"] for i in methods[0]["implementations"]], ["mylib.forms.Form"])
+        self.assertEqual(attribute_shared, [SHARED["mylib.base.Form"]])
+        self.assertEqual(method_shared, [SHARED["mylib.base.Form"]])
+
+    def test_no_shared(self):
+        """Verify that all members are kept when nothing is shared."""
+        attributes, methods, attribute_shared, method_shared = split_shared_members(FORM_DATA, {})
+        self.assertEqual(attributes, FORM_DATA["attributes"])
+        self.assertEqual(methods, FORM_DATA["methods"])
+        self.assertEqual((attribute_shared, method_shared), ([], []))
+
+
+class TestGetSharedMembers(unittest.TestCase):
+    """Test the `get_shared_members` function."""
+
+    def test_same_name_as_shared_ancestor(self):
+        """Verify that only the members of the shared ancestor are found, and not those of a same named class."""
+        attributes, methods = get_shared_members("mylib.base.Form", "Form", {"mylib.forms.Form": FORM_DATA})
+        self.assertEqual([i["name"] for i in attributes], ["base_attr"])
+        self.assertEqual([i["name"] for i in methods], ["clean"])
+        self.assertEqual(methods[0]["implementations"][0]["line_number"], 5)
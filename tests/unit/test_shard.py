@@ -0,0 +1,124 @@
+"""Tests for the shard functions."""
+import json
+import os
+import tempfile
+import unittest
+
+from mkdocs_python_classy.constants import MANIFEST_FILENAME, SHARD_MANIFEST_FILENAME
+from mkdocs_python_classy.shard import get_shard, merge_shards, parse_shard
+
+PAGES = {"classy/a/index.html": "classy/a/", "classy/b/index.html": "classy/b/"}
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as the_file:
+        if isinstance(content, str):
+            the_file.write(content)
+        else:
+            json.dump(content, the_file)
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as the_file:
+        return the_file.read()
+
+
+def _write_shard(site_dir, shard, owned):
+    """Write the site of a shard, which renders the `owned` page and a placeholder for the other page."""
+    _write(os.path.join(site_dir, "index.html"), "home")
+    docs = [{"location": "", "text": "home"}]
+    manifest = {}
+    for dest_uri, url in PAGES.items():
+        text = f"{url} rendered" if dest_uri == owned else f"{url} placeholder"
+        _write(os.path.join(site_dir, dest_uri), text)
+        docs.append({"location": url, "text": text})
+        if dest_uri == owned:
+            docs.append({"location": f"{url}#klass", "text": f"{url} klass"})
+        manifest[dest_uri] = {"hash": f"{shard}-{dest_uri}", "mtime_ns": shard}
+    _write(os.path.join(site_dir, "search", "search_index.json"), {"config": {}, "docs": docs, "index": {}})
+    _write(os.path.join(site_dir, MANIFEST_FILENAME), manifest)
+    _write(
+        os.path.join(site_dir, SHARD_MANIFEST_FILENAME),
+        {"shard": shard, "shards": 2, "pages": {owned: PAGES[owned]}},
+    )
+
+
+class TestParseShard(unittest.TestCase):
+    """Test the `parse_shard` function."""
+
+    def test_valid(self):
+        """Verify that the shard is parsed to the (index, count) tuple."""
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        self.assertEqual(parse_shard("1/1"), (1, 1))
+
+    def test_invalid(self):
+        """Verify that values not in the `i/n` format, or out of range, are rejected."""
+        for value in ["1", "a/b", "1/2/3", "0/2", "3/2", "1/0"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_shard(value)
+
+
+class TestGetShard(unittest.TestCase):
+    """Test the `get_shard` function."""
+
+    def test_in_range_and_stable(self):
+        """Verify that each page is assigned to a shard between 1 and the count, the same on every call."""
+        shards = [get_shard(f"mylib.Klass{i}", 4) for i in range(50)]
+        self.assertEqual(set(shards), {1, 2, 3, 4})
+        self.assertEqual(shards, [get_shard(f"mylib.Klass{i}", 4) for i in range(50)])
+
+
+class TestMergeShards(unittest.TestCase):
+    """Test the `merge_shards` function."""
+
+    def setUp(self):
+        """Write the site of both shards, in a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.shard_1 = os.path.join(self.tmp.name, "shard-1")
+        self.shard_2 = os.path.join(self.tmp.name, "shard-2")
+        self.output = os.path.join(self.tmp.name, "site")
+        _write_shard(self.shard_1, 1, "classy/a/index.html")
+        _write_shard(self.shard_2, 2, "classy/b/index.html")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def test_pages(self):
+        """Verify that each page is taken from the shard that rendered it, in any order of the shards."""
+        merge_shards([self.shard_2, self.shard_1], self.output)
+        self.assertEqual(_read(os.path.join(self.output, "index.html")), "home")
+        self.assertEqual(_read(os.path.join(self.output, "classy/a/index.html")), "classy/a/ rendered")
+        self.assertEqual(_read(os.path.join(self.output, "classy/b/index.html")), "classy/b/ rendered")
+        self.assertFalse(os.path.exists(os.path.join(self.output, SHARD_MANIFEST_FILENAME)))
+
+    def test_search_index(self):
+        """Verify that the entries of each page are taken from its shard, and the prebuilt index is dropped."""
+        merge_shards([self.shard_1, self.shard_2], self.output)
+        search_index = json.loads(_read(os.path.join(self.output, "search", "search_index.json")))
+        self.assertNotIn("index", search_index)
+        self.assertEqual(
+            [doc["text"] for doc in search_index["docs"]],
+            ["home", "classy/a/ rendered", "classy/a/ klass", "classy/b/ rendered", "classy/b/ klass"],
+        )
+
+    def test_hash_manifest(self):
+        """Verify that the hash of each page is taken from its shard."""
+        merge_shards([self.shard_1, self.shard_2], self.output)
+        manifest = json.loads(_read(os.path.join(self.output, MANIFEST_FILENAME)))
+        self.assertEqual(manifest["classy/a/index.html"]["hash"], "1-classy/a/index.html")
+        self.assertEqual(manifest["classy/b/index.html"]["hash"], "2-classy/b/index.html")
+
+    def test_missing_shard(self):
+        """Verify that a missing shard is rejected."""
+        with self.assertRaises(ValueError):
+            merge_shards([self.shard_1], self.output)
+
+    def test_duplicate_shard(self):
+        """Verify that the same shard twice is rejected."""
+        duplicate = os.path.join(self.tmp.name, "shard-1-again")
+        _write_shard(duplicate, 1, "classy/a/index.html")
+        with self.assertRaises(ValueError):
+            merge_shards([self.shard_1, duplicate], self.output)
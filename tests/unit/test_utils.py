@@ -0,0 +1,268 @@
+"""Tests for the utility functions."""
+import argparse
+import collections
+import dataclasses
+import importlib
+import inspect
+import json
+import signal
+import sys
+import time
+import unittest
+from unittest import mock
+
+from mkdocs_python_classy.inspector import AttributeTable, MethodTable
+from mkdocs_python_classy.utils import (
+    BudgetExceeded,
+    get_attribute_code,
+    get_source_attribute_code,
+    get_source_file,
+    time_budget,
+)
+
+# The stdlib modules whose classes are compared, between the parsed source files and `get_attribute_code`.
+STDLIB_MODULES = [
+    "calendar",
+    "collections",
+    "concurrent.futures._base",
+    "csv",
+    "dataclasses",
+    "difflib",
+    "email.message",
+    "http.server",
+    "json.decoder",
+    "logging.handlers",
+    "pathlib",
+    "pprint",
+    "queue",
+    "string",
+    "tempfile",
+    "threading",
+    "unittest.case",
+    "uuid",
+    "weakref",
+]
+
+
+class Parent:  # pylint: disable=too-few-public-methods
+    """Class used to test attribute code."""
+
+    name = "parent"
+    count: int = 1
+    annotated_only: str
+
+    def method(self):
+        """Assignments in methods should not be found."""
+        name = "method"  # noqa: F841 pylint: disable=unused-variable
+        self.value = 1  # pylint: disable=attribute-defined-outside-init
+
+
+class Child(Parent):  # pylint: disable=too-few-public-methods
+    """Subclass used to test attribute code."""
+
+    name = "child"
+    name = "child_twice"
+
+
+@dataclasses.dataclass
+class Point:
+    """Dataclass used to test attribute code, the fields with a `default_factory` are removed from `__dict__`."""
+
+    x: int = 0
+    tags: list = dataclasses.field(default_factory=list)
+
+
+class FieldsMeta(type):
+    """Metaclass that moves the annotated fields off the class, as pydantic models do."""
+
+    def __new__(mcs, name, bases, namespace):
+        """Pop the default of each annotated field from the namespace."""
+        for field_name in namespace.get("__annotations__", {}):
+            namespace.pop(field_name, None)
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class Model(metaclass=FieldsMeta):  # pylint: disable=too-few-public-methods
+    """Model used to test attribute code, with annotated fields that are not in `__dict__`."""
+
+    label: str = "model"
+    plain = "plain"
+
+
+class Outer:  # pylint: disable=too-few-public-methods
+    """Class used to test the qualname of nested classes."""
+
+    outer = "outer"
+
+    class Inner:  # pylint: disable=too-few-public-methods
+        """Nested class."""
+
+        inner = "inner"
+
+
+def make_local():
+    """Create a class within a function."""
+
+    class Local:  # pylint: disable=too-few-public-methods
+        """Class defined within a function."""
+
+        local = "local"
+
+    return Local
+
+
+LOCAL = make_local()
+
+if sys.version_info >= (3,):
+
+    class Conditional:  # pylint: disable=too-few-public-methods
+        """Class defined under an if statement."""
+
+        conditional = "conditional"
+
+else:
+    Conditional = None  # pylint: disable=invalid-name
+
+try:
+
+    class InTry:  # pylint: disable=too-few-public-methods
+        """Class defined under a try statement."""
+
+        in_try = "in_try"
+
+except ImportError:
+    pass
+
+
+class SlowDescriptor:  # pylint: disable=too-few-public-methods
+    """Descriptor that stalls when accessed, such as a lazy or a remote lookup."""
+
+    def __get__(self, instance, owner):
+        """Stall, then fail the same way a misbehaving descriptor would."""
+        time.sleep(1)
+        raise RuntimeError("Slow descriptor.")
+
+
+class Slow:  # pylint: disable=too-few-public-methods
+    """Class used to test the time budget, with attributes that are swept by the inspection."""
+
+    first = SlowDescriptor()
+    second = SlowDescriptor()
+    third = SlowDescriptor()
+
+
+class TestGetAttributeCode(unittest.TestCase):
+    """Test the `get_attribute_code` function."""
+
+    def test_assign_and_annassign(self):
+        """Verify that both Assign and AnnAssign are found, and only on the class body."""
+        self.assertEqual(get_attribute_code(Parent), {"name": "'parent'", "count": "1"})
+
+    def test_last_assignment_wins(self):
+        """Verify that the attributes of the class itself are found, with the last assignment winning."""
+        self.assertEqual(get_attribute_code(Child), {"name": "'child_twice'"})
+
+    def test_annotated_fields(self):
+        """Verify that the annotated fields of dataclasses and pydantic like models are found."""
+        self.assertEqual(get_attribute_code(Point), {"x": "0", "tags": "dataclasses.field(default_factory=list)"})
+        self.assertEqual(get_attribute_code(Model), {"label": "'model'", "plain": "'plain'"})
+
+    def test_annotated_fields_parsed(self):
+        """Verify that the annotated fields are found the same when the source file is parsed by the table."""
+        table = AttributeTable()
+        table.parse([Point, Model])
+        for klass in [Parent, Child, Point, Model]:
+            with self.subTest(klass=klass.__name__):
+                self.assertEqual(table.get_attribute_code(klass), get_attribute_code(klass))
+
+
+class TestGetSourceAttributeCode(unittest.TestCase):
+    """Test the `get_source_attribute_code` function, and the `AttributeTable` built from it."""
+
+    def test_qualnames(self):
+        """Verify that classes are found by their qualname, when nested, local, or defined under a statement."""
+        parsed = get_source_attribute_code(__file__)
+        for klass in [Parent, Outer, Outer.Inner, LOCAL, Conditional, InTry]:
+            with self.subTest(klass=klass.__qualname__):
+                self.assertEqual(parsed[klass.__qualname__], get_attribute_code(klass))
+        self.assertIn("make_local.<locals>.Local", parsed)
+
+    def test_unparsable(self):
+        """Verify that a file that can not be read or parsed is None, so the classes fall back."""
+        self.assertIsNone(get_source_attribute_code("does/not/exist.py"))
+
+    def test_workers(self):
+        """Verify that the source files parsed across processes are the same as the ones parsed in this process."""
+        klasses = [Parent, collections.OrderedDict, json.JSONDecoder, argparse.ArgumentParser]
+        serial = AttributeTable()
+        serial.parse(klasses)
+        parallel = AttributeTable()
+        parallel.parse(klasses, workers=2)
+        self.assertGreater(len(parallel.sources), 1)
+        self.assertEqual(parallel.sources, serial.sources)
+
+    def test_fallback(self):
+        """Verify that `get_attribute_code` is only used for the classes whose source file was not parsed."""
+        table = AttributeTable()
+        table.parse([Child])
+        # OrderedDict is not parsed, as it is not in the MRO of Child.
+        with mock.patch("mkdocs_python_classy.inspector.get_attribute_code", wraps=get_attribute_code) as fallback:
+            self.assertEqual(table.get_attribute_code(Child), {"name": "'child_twice'"})
+            fallback.assert_not_called()
+            expected = get_attribute_code(collections.OrderedDict)
+            self.assertEqual(table.get_attribute_code(collections.OrderedDict), expected)
+            fallback.assert_called_once_with(collections.OrderedDict)
+
+    def test_stdlib(self):
+        """Verify that the parsed source files match `get_attribute_code`, across the classes of the stdlib."""
+        klasses = []
+        for module_name in STDLIB_MODULES:
+            module = importlib.import_module(module_name)
+            klasses.extend(i for i in vars(module).values() if inspect.isclass(i) and i.__module__ == module_name)
+        table = AttributeTable()
+        table.parse(klasses)
+        compared = 0
+        for klass in klasses:
+            try:
+                expected = get_attribute_code(klass)
+            except (OSError, TypeError):
+                continue
+            with self.subTest(klass=f"{klass.__module__}.{klass.__qualname__}"):
+                self.assertIn(klass.__qualname__, table.sources[get_source_file(klass)])
+                self.assertEqual(table.get_attribute_code(klass), expected)
+            compared += 1
+        self.assertGreater(compared, 50)
+
+
+@unittest.skipUnless(hasattr(signal, "setitimer"), "Requires SIGALRM to interrupt the block.")
+class TestTimeBudget(unittest.TestCase):
+    """Test the `time_budget` context manager."""
+
+    def test_interrupts_slow_descriptor(self):
+        """Verify that the budget is not swallowed by a broad except, which would leave later attributes unbudgeted."""
+        start = time.perf_counter()
+        with self.assertRaises(BudgetExceeded):
+            with time_budget(0.2):
+                MethodTable().get_defined_methods(Slow)
+        self.assertLess(time.perf_counter() - start, 0.9)
+
+    def test_late_alarm_restores_handler(self):
+        """Verify that the previous handler is restored, when the alarm goes off while it is being disarmed."""
+        previous = signal.getsignal(signal.SIGALRM)
+        setitimer = signal.setitimer
+
+        def late(which, seconds, *args):
+            setitimer(which, seconds, *args)
+            if seconds == 0:
+                raise BudgetExceeded("Late alarm.")
+
+        with mock.patch("signal.setitimer", side_effect=late):
+            with self.assertRaises(BudgetExceeded):
+                with time_budget(10):
+                    pass
+        self.assertIs(signal.getsignal(signal.SIGALRM), previous)
+
+    def test_disabled(self):
+        """Verify that a budget of None does not raise."""
+        with time_budget(None):
+            pass